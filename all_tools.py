@@ -7,70 +7,273 @@ Windows工具集主入口
 
 import os
 import sys
-import glob
+import ast
 import importlib.util
 import argparse
 import json
 import inspect
 from typing import Dict, Any, List, Tuple, Optional
 
+# JSON编解码：优先使用C实现的orjson（可选依赖），缺失时回退标准库
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 class ToolManager:
     """工具管理器"""
-    
+
+    # 描述缓存文件，避免每次启动都重新解析所有工具文件
+    CACHE_FILENAME = '.tools_cache.json'
+
+    # 安装为发行包时的工具注册入口点组名
+    ENTRY_POINT_GROUP = 'windows_tools.tools'
+
     def __init__(self):
         self.tools = {}
         self.scan_tools()
-    
+
     def scan_tools(self):
-        """扫描目录下所有工具文件"""
+        """扫描所有可用工具
+
+        优先从importlib.metadata入口点（windows_tools.tools组）注册的
+        发行包中发现工具——入口点元数据由安装器缓存，无需扫描文件系统；
+        没有注册任何入口点时（开发模式）回退到扫描本目录的工具文件。
+        """
+        if self._scan_entry_points():
+            return
+        self._scan_tool_files()
+
+    def _scan_entry_points(self) -> bool:
+        """从已安装发行包的入口点加载工具，返回是否发现了工具"""
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python < 3.8
+            return False
+
+        try:
+            eps = entry_points(group=self.ENTRY_POINT_GROUP)
+        except TypeError:  # Python 3.8/3.9的旧版API
+            eps = entry_points().get(self.ENTRY_POINT_GROUP, [])
+
+        found = False
+        for ep in eps:
+            try:
+                module = ep.load()
+                if hasattr(module, 'get_tool_description') and hasattr(module, 'execute_tool'):
+                    description = module.get_tool_description()
+                    self.tools[ep.name] = self._make_record(
+                        description, getattr(module, '__file__', ''), module)
+                    found = True
+            except Exception as e:
+                print(f"警告: 加载入口点工具 {ep.name} 失败: {e}")
+
+        return found
+
+    def _scan_tool_files(self):
+        """扫描目录下所有工具文件
+
+        扫描阶段只通过AST解析提取工具描述，不执行工具模块，
+        模块本身延迟到真正调用工具时才加载（见_ensure_loaded）。
+        工具描述按文件的(mtime_ns, size)缓存到磁盘，文件未变化时
+        直接复用缓存，跳过解析。
+        """
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        tool_files = glob.glob(os.path.join(current_dir, "*.py"))
-        
-        for file_path in tool_files:
-            filename = os.path.basename(file_path)
-            
-            # 跳过主入口文件和基类文件
-            if filename in ["all_tools.py", "tool_base.py"]:
+        cached = self._read_descriptor_cache(current_dir)
+        new_cache = {}
+
+        try:
+            entries = sorted(os.scandir(current_dir), key=lambda e: e.name)
+        except OSError as e:
+            print(f"警告: 扫描工具目录失败: {e}")
+            return
+
+        for entry in entries:
+            filename = entry.name
+
+            # 跳过主入口文件、基类文件和非Python文件
+            if not filename.endswith('.py') or filename in ["all_tools.py", "tool_base.py"]:
                 continue
-                
+
             try:
-                self.load_tool(file_path, filename[:-3])  # 去掉.py后缀
+                tool_name = filename[:-3]  # 去掉.py后缀
+                file_path = entry.path
+
+                try:
+                    stat = entry.stat()
+                    stat_key = [stat.st_mtime_ns, stat.st_size]
+                except OSError:
+                    stat_key = None
+
+                # 文件未变化时直接使用缓存的描述
+                cache_entry = cached.get(filename)
+                if (cache_entry is not None and stat_key is not None
+                        and cache_entry.get('stat') == stat_key):
+                    self.tools[tool_name] = self._make_record(
+                        cache_entry['description'], file_path)
+                    new_cache[filename] = cache_entry
+                    continue
+
+                description = self.parse_tool_description(file_path)
+                if description is not None:
+                    # 静态解析成功，记录描述信息，模块延迟加载
+                    self.tools[tool_name] = self._make_record(description, file_path)
+                else:
+                    # 描述不是静态字面量，回退到立即加载
+                    self.load_tool(file_path, tool_name)
+                    if tool_name in self.tools:
+                        description = self.tools[tool_name]['description']
+
+                if description is not None and stat_key is not None:
+                    new_cache[filename] = {'stat': stat_key, 'description': description}
             except Exception as e:
                 print(f"警告: 加载工具 {filename} 失败: {e}")
-    
+
+        if new_cache != cached:
+            self._write_descriptor_cache(current_dir, new_cache)
+
+    def _read_descriptor_cache(self, current_dir: str) -> Dict[str, Any]:
+        """读取磁盘上的工具描述缓存，失败时返回空缓存"""
+        cache_path = os.path.join(current_dir, self.CACHE_FILENAME)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_descriptor_cache(self, current_dir: str, cache: Dict[str, Any]):
+        """原子写回工具描述缓存，目录只读时静默跳过"""
+        cache_path = os.path.join(current_dir, self.CACHE_FILENAME)
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def parse_tool_description(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """静态解析工具文件，提取描述字典
+
+        不执行模块代码，仅用AST提取get_description/get_tool_description
+        中返回的字典字面量。解析失败时返回None，由调用方回退到完整加载。
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                tree = ast.parse(f.read())
+        except (OSError, SyntaxError):
+            return None
+
+        # 必须实现标准接口函数，否则不是工具文件
+        top_level_names = {node.name for node in tree.body
+                           if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        if 'get_tool_description' not in top_level_names or 'execute_tool' not in top_level_names:
+            return None
+
+        # 模块级的字典常量赋值，供返回常量名的描述函数解引用
+        module_constants = {}
+        for node in tree.body:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Dict)):
+                module_constants[node.targets[0].id] = node.value
+
+        # 在模块和类两个层级查找描述函数中返回的字典字面量
+        candidates = []
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                candidates.append(node)
+            elif isinstance(node, ast.ClassDef):
+                candidates.extend(n for n in node.body if isinstance(n, ast.FunctionDef))
+
+        for func in candidates:
+            if func.name not in ('get_description', 'get_tool_description'):
+                continue
+            for stmt in ast.walk(func):
+                if not isinstance(stmt, ast.Return):
+                    continue
+                value = stmt.value
+                # return 模块级常量名的情况，解引用到对应的字典字面量
+                if isinstance(value, ast.Name):
+                    value = module_constants.get(value.id)
+                if isinstance(value, ast.Dict):
+                    try:
+                        return ast.literal_eval(value)
+                    except ValueError:
+                        continue
+
+        return None
+
+    def _make_record(self, description: Dict[str, Any], file_path: str,
+                     module=None) -> Dict[str, Any]:
+        """构建工具描述记录，必需/可选参数名在此一次性算好"""
+        params = description.get('parameters', {}) or {}
+        required = tuple(name for name, info in params.items()
+                         if info.get('required', False))
+        optional = tuple(name for name in params if name not in required)
+        return {
+            'module': module,
+            'description': description,
+            'file_path': file_path,
+            'required': required,
+            'optional': optional
+        }
+
     def load_tool(self, file_path: str, tool_name: str):
         """加载单个工具"""
-        spec = importlib.util.spec_from_file_location(tool_name, file_path)
-        if spec is None or spec.loader is None:
+        module = self._import_module(file_path, tool_name)
+        if module is None:
             return
-            
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
+
         # 检查是否有必需的函数
         if hasattr(module, 'get_tool_description') and hasattr(module, 'execute_tool'):
             description = module.get_tool_description()
-            self.tools[tool_name] = {
-                'module': module,
-                'description': description,
-                'file_path': file_path
-            }
-    
+            self.tools[tool_name] = self._make_record(description, file_path, module)
+
+    def _import_module(self, file_path: str, tool_name: str):
+        """导入工具模块"""
+        spec = importlib.util.spec_from_file_location(tool_name, file_path)
+        if spec is None or spec.loader is None:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def _ensure_loaded(self, tool_name: str):
+        """确保工具模块已加载（延迟加载入口）"""
+        tool_info = self.tools[tool_name]
+        if tool_info['module'] is None:
+            tool_info['module'] = self._import_module(tool_info['file_path'], tool_name)
+            if tool_info['module'] is None:
+                raise ValueError(f"工具 '{tool_name}' 加载失败")
+        return tool_info['module']
+
     def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """获取工具信息"""
         return self.tools.get(tool_name)
-    
+
     def list_tools(self) -> Dict[str, Dict[str, Any]]:
         """列出所有工具"""
         return self.tools
-    
+
     def execute_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
         """执行指定工具"""
         if tool_name not in self.tools:
             raise ValueError(f"工具 '{tool_name}' 不存在")
-        
-        tool_info = self.tools[tool_name]
-        return tool_info['module'].execute_tool(args)
+
+        module = self._ensure_loaded(tool_name)
+        return module.execute_tool(args)
 
 
 def print_help(tool_manager: ToolManager):
@@ -131,9 +334,10 @@ def print_tool_help(tool_manager: ToolManager, tool_name: str):
     
     print("使用方法:")
     if 'parameters' in desc and desc['parameters']:
-        required_params = [name for name, info in desc['parameters'].items() if info.get('required', False)]
-        optional_params = [name for name, info in desc['parameters'].items() if not info.get('required', False)]
-        
+        # 必需/可选参数在工具扫描时已经算好，直接取用
+        required_params = tool_info['required']
+        optional_params = tool_info['optional']
+
         usage = f"  python all_tools.py {tool_name}"
         if required_params:
             usage += " " + " ".join([f"-{param} <值>" for param in required_params])
@@ -146,97 +350,121 @@ def print_tool_help(tool_manager: ToolManager, tool_name: str):
     print(f"  python {tool_name}.py -h  (独立运行帮助)")
 
 
+# 布尔参数接受的真值写法
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+# 参数类型到转换函数的查表，代替逐参数的if/elif链
+_CONVERTERS = {
+    'int': int,
+    'float': float,
+    'bool': _to_bool,
+    'string': lambda v: v,
+}
+
+
 def parse_tool_args(args: List[str], tool_description: Dict[str, Any]) -> Dict[str, Any]:
     """解析工具参数"""
     result = {}
     parameters = tool_description.get('parameters', {})
-    
+
     i = 0
     while i < len(args):
         if args[i].startswith('-'):
             param_name = args[i][1:]  # 去掉前缀的-
-            
-            if param_name not in parameters:
+
+            param_info = parameters.get(param_name)
+            if param_info is None:
                 raise ValueError(f"未知参数: {param_name}")
-            
+
             if i + 1 >= len(args):
                 raise ValueError(f"参数 {param_name} 需要一个值")
-            
-            param_value = args[i + 1]
-            param_type = parameters[param_name].get('type', 'string')
-            
+
             # 类型转换
-            if param_type == 'int':
-                param_value = int(param_value)
-            elif param_type == 'float':
-                param_value = float(param_value)
-            elif param_type == 'bool':
-                param_value = param_value.lower() in ('true', '1', 'yes', 'on')
-            
-            result[param_name] = param_value
+            convert = _CONVERTERS.get(param_info.get('type', 'string'), str)
+            result[param_name] = convert(args[i + 1])
             i += 2
         else:
             raise ValueError(f"意外的参数: {args[i]}")
-    
-    # 检查必需参数
-    for param_name, param_info in parameters.items():
-        if param_info.get('required', False) and param_name not in result:
-            raise ValueError(f"缺少必需参数: {param_name}")
-    
+
+    # 检查必需参数（集合差在C层一次完成）
+    required = {name for name, info in parameters.items() if info.get('required', False)}
+    missing = required - result.keys()
+    if missing:
+        raise ValueError(f"缺少必需参数: {', '.join(sorted(missing))}")
+
     return result
 
 
+def _build_tools_list(tool_manager: ToolManager) -> List[Dict[str, Any]]:
+    """构建MCP tools/list响应中的工具定义列表"""
+    tools_list = []
+    for tool_name, tool_info in tool_manager.tools.items():
+        desc = tool_info['description']
+        tool_def = {
+            'name': tool_name,
+            'description': desc.get('description', ''),
+            'inputSchema': {
+                'type': 'object',
+                'properties': {},
+                'required': []
+            }
+        }
+
+        # 添加参数定义
+        if 'parameters' in desc:
+            for param_name, param_info in desc['parameters'].items():
+                tool_def['inputSchema']['properties'][param_name] = {
+                    'type': param_info.get('type', 'string'),
+                    'description': param_info.get('description', '')
+                }
+                if param_info.get('required', False):
+                    tool_def['inputSchema']['required'].append(param_name)
+
+        tools_list.append(tool_def)
+
+    return tools_list
+
+
 def run_mcp_server(tool_manager: ToolManager):
     """运行MCP服务器模式"""
     print("启动MCP服务器模式...")
     print("等待MCP调用...")
-    
+
+    # 工具集在服务器生命周期内不变，tools/list响应只构建一次
+    cached_tools_list = _build_tools_list(tool_manager)
+
+    # 直接迭代stdin并手动写stdout：input()/print()每次请求都会
+    # 额外刷新缓冲，这里只在完整响应写出后flush一次
+    out = sys.stdout
+    write = out.write
+
     # 这里可以实现MCP服务器逻辑
     # 暂时提供一个简单的实现
-    while True:
+    for line in sys.stdin:
         try:
             # 读取JSON-RPC请求
-            line = input()
-            if not line:
+            if not line.strip():
                 continue
-                
-            request = json.loads(line)
+
+            request = _json_loads(line)
             method = request.get('method', '')
-            
+
             if method == 'tools/list':
                 # 返回所有工具列表
-                tools_list = []
-                for tool_name, tool_info in tool_manager.tools.items():
-                    desc = tool_info['description']
-                    tool_def = {
-                        'name': tool_name,
-                        'description': desc.get('description', ''),
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {},
-                            'required': []
-                        }
-                    }
-                    
-                    # 添加参数定义
-                    if 'parameters' in desc:
-                        for param_name, param_info in desc['parameters'].items():
-                            tool_def['inputSchema']['properties'][param_name] = {
-                                'type': param_info.get('type', 'string'),
-                                'description': param_info.get('description', '')
-                            }
-                            if param_info.get('required', False):
-                                tool_def['inputSchema']['required'].append(param_name)
-                    
-                    tools_list.append(tool_def)
-                
                 response = {
                     'jsonrpc': '2.0',
                     'id': request.get('id'),
-                    'result': {'tools': tools_list}
+                    'result': {'tools': cached_tools_list}
                 }
-                print(json.dumps(response))
-                
+                write(_json_dumps(response))
+                write('\n')
+                out.flush()
+
             elif method == 'tools/call':
                 # 调用工具
                 tool_name = request['params']['name']
@@ -255,9 +483,11 @@ def run_mcp_server(tool_manager: ToolManager):
                         'id': request.get('id'),
                         'error': {'code': -1, 'message': str(e)}
                     }
-                    
-                print(json.dumps(response))
-                
+
+                write(_json_dumps(response))
+                write('\n')
+                out.flush()
+
         except KeyboardInterrupt:
             break
         except Exception as e:
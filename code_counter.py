@@ -5,61 +5,203 @@
 支持指定文件夹、正则表达式匹配文件名、递归检测等功能
 """
 
+import functools
+import io
 import os
 import re
 import sys
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, Any, List, Tuple
 from tool_base import BaseTool
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> 're.Pattern':
+    """编译文件名匹配正则，缓存结果避免重复调用时反复编译"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# 注释行前缀，str.startswith接受元组并在C层一次完成全部比较
+_COMMENT_PREFIXES = (b'//', b'#', b'/*', b'*', b'<!--')
+
+
+# 可选的Numba JIT加速：单次线性扫描同时完成行数/非空行/代码行统计。
+# numba是可选依赖，缺失时走下面的纯Python分块统计路径
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _count_lines_kernel(buf):
+        """对uint8缓冲区做一次线性扫描，返回(总行数, 非空行数, 代码行数)
+
+        注释判定与_COMMENT_PREFIXES一致：#、*、//、/*、<!--开头的行。
+        """
+        n = buf.size
+        total = 0
+        non_empty = 0
+        code = 0
+        i = 0
+        while i < n:
+            # 找到行尾
+            j = i
+            while j < n and buf[j] != 10:  # '\n'
+                j += 1
+            total += 1
+
+            # 找到行内第一个非空白字节
+            k = i
+            while k < j:
+                c = buf[k]
+                if c != 32 and c != 9 and c != 13 and c != 11 and c != 12:
+                    break
+                k += 1
+
+            if k < j:
+                non_empty += 1
+                c = buf[k]
+                is_comment = False
+                if c == 35 or c == 42:  # '#' '*'
+                    is_comment = True
+                elif c == 47 and k + 1 < j:  # '/'
+                    c2 = buf[k + 1]
+                    if c2 == 47 or c2 == 42:  # '//' '/*'
+                        is_comment = True
+                elif c == 60 and k + 3 < j:  # '<'
+                    if buf[k + 1] == 33 and buf[k + 2] == 45 and buf[k + 3] == 45:  # '<!--'
+                        is_comment = True
+                if not is_comment:
+                    code += 1
+
+            i = j + 1
+
+        return total, non_empty, code
+else:
+    _count_lines_kernel = None
+
+
+# 递归扫描时默认跳过的目录：版本控制、依赖、构建产物和各种缓存，
+# 这些目录往往把文件数放大几十倍且统计结果没有意义
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__',
+    '.venv', 'venv', 'dist', 'build', '.tox',
+    '.mypy_cache', '.pytest_cache',
+})
+
+
+# 识别最常见的"按扩展名过滤"形式，如 \.py$ 或 \.py$|\.js$，
+# 这类模式可以退化为一次C层的endswith调用，完全绕过正则引擎
+_PATTERN_AS_SUFFIXES = re.compile(r'^\\\.[A-Za-z0-9]+\$(\|\\\.[A-Za-z0-9]+\$)*$')
+
+
+def _pattern_to_suffixes(pattern: str) -> 'Tuple[str, ...]':
+    """将扩展名形式的正则转换为后缀元组，非此形式时返回空元组"""
+    if not _PATTERN_AS_SUFFIXES.match(pattern):
+        return ()
+    return tuple('.' + part[2:-1].lower() for part in pattern.split('|'))
+
+
+def _extension_of(path: str) -> str:
+    """提取小写扩展名；点必须落在文件名内部，隐藏文件视为无扩展名"""
+    head, dot, tail = path.rpartition('.')
+    if dot and '/' not in tail and '\\' not in tail and head and not head.endswith(('/', '\\')):
+        return '.' + tail.lower()
+    return '(无扩展名)'
+
+
+class FileStat:
+    """单个文件的统计结果
+
+    使用__slots__代替字典，降低大规模扫描时每个文件的内存开销，
+    属性访问也比字典键查找更快。
+    """
+    __slots__ = ('path', 'relative_path', 'lines', 'non_empty', 'code', 'size')
+
+    def __init__(self, path: str, relative_path: str,
+                 lines: int, non_empty: int, code: int, size: int):
+        self.path = path
+        self.relative_path = relative_path
+        self.lines = lines
+        self.non_empty = non_empty
+        self.code = code
+        self.size = size
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "code_counter",
+    "description": "统计指定文件夹内代码文件的行数，支持正则表达式匹配和递归检测",
+    "parameters": {
+        "folder": {
+            "type": "string",
+            "description": "要统计的目标文件夹路径",
+            "required": True
+        },
+        "pattern": {
+            "type": "string",
+            "description": "匹配文件名的正则表达式（如：\\\\.py$|\\\\.js$）",
+            "required": False,
+            "default": ".*"
+        },
+        "recursive": {
+            "type": "bool",
+            "description": "是否递归检测子目录",
+            "required": False,
+            "default": True
+        },
+        "exclude_empty": {
+            "type": "bool", 
+            "description": "是否排除空行",
+            "required": False,
+            "default": False
+        },
+        "show_details": {
+            "type": "bool",
+            "description": "是否显示每个文件的详细信息",
+            "required": False,
+            "default": True
+        },
+        "sort_by": {
+            "type": "string",
+            "description": "排序方式：name(文件名), size(行数), none(不排序)",
+            "required": False,
+            "default": "name"
+        },
+        "exclude_dirs": {
+            "type": "string",
+            "description": "额外排除的目录名，逗号分隔（默认已排除.git、node_modules、__pycache__等）",
+            "required": False,
+            "default": ""
+        },
+        "max_depth": {
+            "type": "int",
+            "description": "递归扫描的最大深度，0表示不限制",
+            "required": False,
+            "default": 0
+        },
+        "follow_symlinks": {
+            "type": "bool",
+            "description": "是否跟随符号链接（跟随可能导致循环或重复统计）",
+            "required": False,
+            "default": False
+        }
+    }
+}
+
+
 class CodeCounterTool(BaseTool):
     """代码行数统计工具类"""
     
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "code_counter",
-            "description": "统计指定文件夹内代码文件的行数，支持正则表达式匹配和递归检测",
-            "parameters": {
-                "folder": {
-                    "type": "string",
-                    "description": "要统计的目标文件夹路径",
-                    "required": True
-                },
-                "pattern": {
-                    "type": "string",
-                    "description": "匹配文件名的正则表达式（如：\\\\.py$|\\\\.js$）",
-                    "required": False,
-                    "default": ".*"
-                },
-                "recursive": {
-                    "type": "bool",
-                    "description": "是否递归检测子目录",
-                    "required": False,
-                    "default": True
-                },
-                "exclude_empty": {
-                    "type": "bool", 
-                    "description": "是否排除空行",
-                    "required": False,
-                    "default": False
-                },
-                "show_details": {
-                    "type": "bool",
-                    "description": "是否显示每个文件的详细信息",
-                    "required": False,
-                    "default": True
-                },
-                "sort_by": {
-                    "type": "string",
-                    "description": "排序方式：name(文件名), size(行数), none(不排序)",
-                    "required": False,
-                    "default": "name"
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def count_file_lines(self, file_path: str, exclude_empty: bool = False) -> Tuple[int, int, int]:
         """
         统计单个文件的行数
@@ -67,63 +209,122 @@ class CodeCounterTool(BaseTool):
         Returns:
             (总行数, 非空行数, 代码行数)
         """
+        total_lines = 0
+        non_empty_lines = 0
+        code_lines = 0
+
+        # JIT内核可用时整读文件并一次扫描完成全部统计
+        if _count_lines_kernel is not None:
+            try:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                if not data:
+                    return 0, 0, 0
+                total, non_empty, code = _count_lines_kernel(
+                    _np.frombuffer(data, dtype=_np.uint8))
+                return int(total), int(non_empty), int(code)
+            except Exception as e:
+                print(f"警告: 无法读取文件 {file_path}: {e}")
+                return 0, 0, 0
+
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            total_lines = len(lines)
-            non_empty_lines = 0
-            code_lines = 0
-            
-            for line in lines:
-                stripped = line.strip()
-                if stripped:  # 非空行
+            # 按64KB块增量读取，内存占用与文件大小无关；
+            # 跨块的不完整行保留到下一轮处理
+            with open(file_path, 'rb') as f:
+                read = f.read
+                tail = b''
+
+                while True:
+                    chunk = read(65536)
+                    if not chunk:
+                        break
+
+                    lines = (tail + chunk).split(b'\n')
+                    tail = lines.pop()  # 最后一段可能是不完整行
+                    total_lines += len(lines)
+
+                    for line in lines:
+                        stripped = line.strip()
+                        if stripped:  # 非空行
+                            non_empty_lines += 1
+                            # 简单的注释检测（可以根据需要扩展）
+                            if not stripped.startswith(_COMMENT_PREFIXES) and stripped != b'*/':
+                                code_lines += 1
+
+            # 文件末尾没有换行符的最后一行
+            if tail:
+                total_lines += 1
+                stripped = tail.strip()
+                if stripped:
                     non_empty_lines += 1
-                    # 简单的注释检测（可以根据需要扩展）
-                    if not (stripped.startswith('//') or 
-                           stripped.startswith('#') or
-                           stripped.startswith('/*') or
-                           stripped.startswith('*') or
-                           stripped.startswith('<!--') or
-                           stripped == '*/'):
+                    if not stripped.startswith(_COMMENT_PREFIXES) and stripped != b'*/':
                         code_lines += 1
-            
+
             return total_lines, non_empty_lines, code_lines
-            
+
         except Exception as e:
             print(f"警告: 无法读取文件 {file_path}: {e}")
             return 0, 0, 0
     
-    def scan_directory(self, folder_path: str, pattern: str, recursive: bool) -> List[str]:
-        """扫描目录，返回匹配的文件列表"""
+    def scan_directory(self, folder_path: str, pattern: str, recursive: bool,
+                       exclude_dirs: str = '', max_depth: int = 0,
+                       follow_symlinks: bool = False) -> List[Tuple[str, int]]:
+        """扫描目录，返回匹配的(文件路径, 文件大小)列表"""
         matched_files = []
-        
-        try:
-            compiled_pattern = re.compile(pattern, re.IGNORECASE)
-        except re.error as e:
-            raise ValueError(f"正则表达式错误: {e}")
-        
+
+        # 默认排除集合 + 用户指定的额外目录
+        excludes = DEFAULT_EXCLUDE_DIRS
+        if exclude_dirs:
+            extra = {d.strip() for d in exclude_dirs.split(',') if d.strip()}
+            if extra:
+                excludes = excludes | extra
+
+        # 默认/空模式匹配所有文件，跳过正则引擎
+        suffixes = _pattern_to_suffixes(pattern) if pattern else ()
+        if pattern in ('.*', '', None):
+            match = lambda name: True
+        elif suffixes:
+            # 纯扩展名模式退化为一次endswith调用
+            match = lambda name: name.lower().endswith(suffixes)
+        else:
+            try:
+                match = _compile_pattern(pattern).search
+            except re.error as e:
+                raise ValueError(f"正则表达式错误: {e}")
+
         if not os.path.exists(folder_path):
             raise ValueError(f"文件夹不存在: {folder_path}")
-        
+
         if not os.path.isdir(folder_path):
             raise ValueError(f"路径不是文件夹: {folder_path}")
-        
-        # 使用os.walk进行递归或非递归扫描
-        if recursive:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if compiled_pattern.search(file):
-                        matched_files.append(os.path.join(root, file))
-        else:
+
+        # 使用os.scandir扫描，目录项自带类型和大小信息，避免额外的stat调用
+        def _scan(path: str, depth: int):
             try:
-                for item in os.listdir(folder_path):
-                    item_path = os.path.join(folder_path, item)
-                    if os.path.isfile(item_path) and compiled_pattern.search(item):
-                        matched_files.append(item_path)
+                entries = os.scandir(path)
             except PermissionError as e:
-                raise ValueError(f"无权限访问文件夹: {e}")
-        
+                if depth == 0:
+                    raise ValueError(f"无权限访问文件夹: {e}")
+                return  # 递归时跳过无权限的子目录
+
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=follow_symlinks):
+                            if match(entry.name):
+                                try:
+                                    file_size = entry.stat().st_size
+                                except OSError:
+                                    file_size = 0
+                                matched_files.append((entry.path, file_size))
+                        elif (recursive and entry.is_dir(follow_symlinks=follow_symlinks)
+                                and entry.name not in excludes
+                                and (max_depth <= 0 or depth + 1 < max_depth)):
+                            _scan(entry.path, depth + 1)
+                    except OSError:
+                        continue
+
+        _scan(folder_path, 0)
         return matched_files
     
     def format_file_size(self, size_bytes: int) -> str:
@@ -146,10 +347,14 @@ class CodeCounterTool(BaseTool):
         exclude_empty = args.get('exclude_empty', False)
         show_details = args.get('show_details', True)
         sort_by = args.get('sort_by', 'name').lower()
-        
+        exclude_dirs = args.get('exclude_dirs', '')
+        max_depth = args.get('max_depth', 0)
+        follow_symlinks = args.get('follow_symlinks', False)
+
         # 扫描文件
         try:
-            matched_files = self.scan_directory(folder, pattern, recursive)
+            matched_files = self.scan_directory(folder, pattern, recursive, exclude_dirs,
+                                                max_depth, follow_symlinks)
         except Exception as e:
             return f"扫描失败: {e}"
         
@@ -164,99 +369,107 @@ class CodeCounterTool(BaseTool):
         total_code_lines = 0
         total_size = 0
         
-        for file_path in matched_files:
-            lines, non_empty, code = self.count_file_lines(file_path, exclude_empty)
-            try:
-                file_size = os.path.getsize(file_path)
-            except OSError:
-                file_size = 0
-            
-            file_stats.append({
-                'path': file_path,
-                'relative_path': os.path.relpath(file_path, folder),
-                'lines': lines,
-                'non_empty': non_empty, 
-                'code': code,
-                'size': file_size
-            })
-            
+        # 文件读取是I/O密集操作，多文件时用线程池并发统计；
+        # 文件很少时直接串行，省去线程池开销
+        def count_one(item: Tuple[str, int]) -> Tuple[str, int, Tuple[int, int, int]]:
+            file_path, file_size = item
+            return file_path, file_size, self.count_file_lines(file_path, exclude_empty)
+
+        if total_files >= 4:
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                counted = list(executor.map(count_one, matched_files))
+        else:
+            counted = [count_one(item) for item in matched_files]
+
+        # 相对路径直接按前缀切片得到，避免逐文件调用os.path.relpath
+        folder_prefix = folder if folder.endswith(os.sep) else folder + os.sep
+
+        # 扩展名汇总在统计循环内一并完成，单次遍历即可
+        extension_stats = defaultdict(lambda: [0, 0])  # ext -> [文件数, 行数]
+
+        for file_path, file_size, (lines, non_empty, code) in counted:
             total_lines += lines
             total_non_empty += non_empty
             total_code_lines += code
             total_size += file_size
-        
+
+            entry = extension_stats[_extension_of(file_path)]
+            entry[0] += 1
+            entry[1] += lines
+
+            # 不展示明细时无需保留逐文件记录，也省掉后面的排序
+            if show_details:
+                if file_path.startswith(folder_prefix):
+                    relative_path = file_path[len(folder_prefix):]
+                else:
+                    relative_path = os.path.relpath(file_path, folder)
+
+                file_stats.append(FileStat(file_path, relative_path,
+                                           lines, non_empty, code, file_size))
+
         # 排序
-        if sort_by == 'size':
-            file_stats.sort(key=lambda x: x['lines'], reverse=True)
-        elif sort_by == 'name':
-            file_stats.sort(key=lambda x: x['relative_path'])
-        # sort_by == 'none' 时不排序
-        
-        # 格式化输出
-        result_lines = []
-        result_lines.append("代码行数统计报告")
-        result_lines.append("=" * 50)
-        result_lines.append(f"扫描路径: {os.path.abspath(folder)}")
-        result_lines.append(f"文件模式: {pattern}")
-        result_lines.append(f"递归扫描: {'是' if recursive else '否'}")
-        result_lines.append(f"排除空行: {'是' if exclude_empty else '否'}")
-        result_lines.append("")
+        # attrgetter是C实现，大列表排序时比lambda取键更快
+        if show_details:
+            if sort_by == 'size':
+                file_stats.sort(key=attrgetter('lines'), reverse=True)
+            elif sort_by == 'name':
+                file_stats.sort(key=attrgetter('relative_path'))
+            # sort_by == 'none' 时不排序
         
+        # 格式化输出：统一写入StringIO缓冲，避免大量临时字符串拼接
+        buf = io.StringIO()
+        buf.write("代码行数统计报告\n")
+        buf.write("=" * 50 + "\n")
+        buf.write(f"扫描路径: {os.path.abspath(folder)}\n")
+        buf.write(f"文件模式: {pattern}\n")
+        buf.write(f"递归扫描: {'是' if recursive else '否'}\n")
+        buf.write(f"排除空行: {'是' if exclude_empty else '否'}\n")
+        buf.write("\n")
+
         if show_details:
-            result_lines.append("文件详情:")
-            result_lines.append("-" * 80)
-            
-            # 表头
-            result_lines.append(f"{'文件路径':<50} {'总行数':<8} {'非空行':<8} {'代码行':<8} {'文件大小':<10}")
-            result_lines.append("-" * 80)
-            
+            buf.write("文件详情:\n")
+            buf.write("-" * 80 + "\n")
+
+            # 表头和行模板只构建一次
+            row_format = "{:<50} {:<8} {:<8} {:<8} {:<10}\n".format
+            buf.write(row_format('文件路径', '总行数', '非空行', '代码行', '文件大小'))
+            buf.write("-" * 80 + "\n")
+
             # 文件详情
             for stat in file_stats:
-                relative_path = stat['relative_path']
+                relative_path = stat.relative_path
                 if len(relative_path) > 47:
                     relative_path = "..." + relative_path[-44:]
-                
-                result_lines.append(
-                    f"{relative_path:<50} "
-                    f"{stat['lines']:<8} "
-                    f"{stat['non_empty']:<8} "
-                    f"{stat['code']:<8} "
-                    f"{self.format_file_size(stat['size']):<10}"
-                )
-            
-            result_lines.append("-" * 80)
-        
+
+                buf.write(row_format(
+                    relative_path,
+                    stat.lines,
+                    stat.non_empty,
+                    stat.code,
+                    self.format_file_size(stat.size)
+                ))
+
+            buf.write("-" * 80 + "\n")
+
         # 统计汇总
-        result_lines.append("")
-        result_lines.append("统计汇总:")
-        result_lines.append(f"  匹配文件数: {total_files}")
-        result_lines.append(f"  总行数: {total_lines:,}")
-        result_lines.append(f"  非空行数: {total_non_empty:,}")
-        result_lines.append(f"  代码行数: {total_code_lines:,}")
-        result_lines.append(f"  总文件大小: {self.format_file_size(total_size)}")
-        
+        buf.write("\n统计汇总:\n")
+        buf.write(f"  匹配文件数: {total_files}\n")
+        buf.write(f"  总行数: {total_lines:,}\n")
+        buf.write(f"  非空行数: {total_non_empty:,}\n")
+        buf.write(f"  代码行数: {total_code_lines:,}\n")
+        buf.write(f"  总文件大小: {self.format_file_size(total_size)}\n")
+
         if total_files > 0:
-            result_lines.append(f"  平均行数/文件: {total_lines / total_files:.1f}")
-        
-        # 文件类型统计
-        extension_stats = {}
-        for stat in file_stats:
-            ext = os.path.splitext(stat['path'])[1].lower()
-            if not ext:
-                ext = '(无扩展名)'
-            
-            if ext not in extension_stats:
-                extension_stats[ext] = {'count': 0, 'lines': 0}
-            extension_stats[ext]['count'] += 1
-            extension_stats[ext]['lines'] += stat['lines']
-        
+            buf.write(f"  平均行数/文件: {total_lines / total_files:.1f}\n")
+
+        # 文件类型统计（已在统计循环中汇总）
         if len(extension_stats) > 1:
-            result_lines.append("")
-            result_lines.append("按文件类型统计:")
-            for ext, stats in sorted(extension_stats.items()):
-                result_lines.append(f"  {ext}: {stats['count']} 文件, {stats['lines']:,} 行")
-        
-        return "\n".join(result_lines)
+            buf.write("\n按文件类型统计:\n")
+            for ext, (count, lines) in sorted(extension_stats.items()):
+                buf.write(f"  {ext}: {count} 文件, {lines:,} 行\n")
+
+        return buf.getvalue().rstrip('\n')
 
 
 # 实例化工具
@@ -292,7 +505,13 @@ def main():
     parser.add_argument('-sort_by', type=str, default='name',
                        choices=['name', 'size', 'none'],
                        help='排序方式')
-    
+    parser.add_argument('-exclude_dirs', type=str, default='',
+                       help='额外排除的目录名，逗号分隔')
+    parser.add_argument('-max_depth', type=int, default=0,
+                       help='递归扫描的最大深度，0表示不限制')
+    parser.add_argument('-follow_symlinks', type=str, default='false',
+                       help='是否跟随符号链接 (true/false)')
+
     args = parser.parse_args()
     
     # 转换为字典格式（处理布尔值）
@@ -305,7 +524,10 @@ def main():
         'recursive': str_to_bool(args.recursive),
         'exclude_empty': str_to_bool(args.exclude_empty),
         'show_details': str_to_bool(args.show_details),
-        'sort_by': args.sort_by
+        'sort_by': args.sort_by,
+        'exclude_dirs': args.exclude_dirs,
+        'max_depth': args.max_depth,
+        'follow_symlinks': str_to_bool(args.follow_symlinks)
     }
     
     # 执行工具
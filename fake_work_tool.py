@@ -9,53 +9,156 @@ import sys
 import time
 import random
 import os
+import signal
 import threading
-from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from tool_base import BaseTool
 
 
+# 各场景使用的文案池。提升到模块级元组/字典，
+# 避免在循环中每轮重建列表和字典字面量
+_PROJECTS = ('CoreEngine', 'NetworkModule', 'DatabaseLayer', 'UIFramework', 'MathUtils')
+_CMAKE_ACTIONS = ('Configuring', 'Building', 'Linking', 'Generating', 'Installing')
+_CMAKE_FILE_NAMES = ('main', 'utils', 'config', 'handler', 'service')
+_CMAKE_FILE_TYPES = ('.cpp', '.h', '.cmake', '.proto', '.cc')
+_CMAKE_DEPENDENCIES = ('OpenSSL', 'Boost', 'Qt5', 'gRPC', 'Protobuf')
+
+_LANGUAGES = ('C++', 'Python', 'Java', 'Go', 'Rust')
+_SRC_DIRS = ('src', 'lib', 'core', 'utils', 'modules', 'services')
+_SRC_FILES = ('main', 'handler', 'parser', 'validator', 'controller', 'model')
+_EXTENSIONS = {
+    'C++': ('.cpp', '.cc', '.cxx'),
+    'Python': ('.py',),
+    'Java': ('.java',),
+    'Go': ('.go',),
+    'Rust': ('.rs',)
+}
+_COMPILER_COMMANDS = {
+    'C++': 'g++ -O2 -std=c++17 -c {}',
+    'Python': 'python -m py_compile {}',
+    'Java': 'javac -cp ./lib/* {}',
+    'Go': 'go build {}',
+    'Rust': 'rustc --edition 2021 {}'
+}
+# 整行编译输出模板：把序号前缀和文件路径槽位预先拼进命令里，
+# 循环内对选好的模板做一次format即可
+_COMPILE_LINE_TEMPLATES = {
+    lang: '[{i:3d}/40] ' + command.replace('{}', '{dir}/{file}{ext}')
+    for lang, command in _COMPILER_COMMANDS.items()
+}
+_COMPILE_WARNINGS = (
+    "warning: unused variable 'temp'",
+    "warning: implicit conversion from double to int",
+    "info: optimization level set to O2",
+    "note: including precompiled headers"
+)
+
+_TEST_SUITES = ('unit_tests', 'integration_tests', 'e2e_tests', 'performance_tests')
+_TEST_NAMES = (
+    'test_user_authentication',
+    'test_database_connection',
+    'test_api_response_time',
+    'test_data_validation',
+    'test_error_handling',
+    'test_memory_leak',
+    'test_concurrent_access',
+    'test_security_headers'
+)
+_TEST_ERROR_MSGS = (
+    "    AssertionError: Expected 200, got 404",
+    "    TimeoutError: Connection timeout after 5s",
+    "    ValueError: Invalid input parameter",
+    "    DatabaseError: Connection refused"
+)
+
+_ENVIRONMENTS = ('staging', 'production', 'testing')
+_DEPLOYMENT_STEPS = (
+    ("准备Docker镜像", "docker build -t app:latest ."),
+    ("推送镜像到仓库", "docker push registry.company.com/app:latest"),
+    ("更新Kubernetes配置", "kubectl apply -f deployment.yaml"),
+    ("执行数据库迁移", "python manage.py migrate"),
+    ("更新配置文件", "kubectl create configmap app-config"),
+    ("滚动更新服务", "kubectl rollout restart deployment/app"),
+    ("等待Pod就绪", "kubectl wait --for=condition=ready pod"),
+    ("运行健康检查", "curl -f http://app/health"),
+    ("更新负载均衡", "kubectl patch service app"),
+    ("清理旧版本", "docker system prune -f")
+)
+
+_ANALYSIS_TOOLS = ('SonarQube', 'ESLint', 'PyLint', 'SpotBugs', 'CodeClimate')
+_ANALYSIS_TYPES = (
+    ("静态代码分析", "正在扫描代码质量问题..."),
+    ("安全漏洞检查", "正在检查潜在安全风险..."),
+    ("性能分析", "正在分析性能瓶颈..."),
+    ("代码重复检测", "正在检测重复代码..."),
+    ("依赖关系分析", "正在分析项目依赖...")
+)
+_ANALYSIS_SRC_DIRS = ('controllers', 'models', 'utils', 'services')
+_ANALYSIS_SRC_FILES = ('user', 'auth', 'data', 'config')
+_ISSUE_TYPES = ('代码异味', '安全风险', '性能问题', '重复代码', '复杂度过高')
+
+# 工具描述只读不改，构建一次供get_description直接返回
+_DESCRIPTION = {
+    "name": "fake_work_tool",
+    "description": "假装在工作的工具，模拟各种开发任务，让命令行看起来很忙碌",
+    "parameters": {
+        "duration": {
+            "type": "int",
+            "description": "持续时间（分钟），默认30分钟",
+            "required": False,
+            "default": 30
+        },
+        "scenario": {
+            "type": "string",
+            "description": "工作场景：cmake(构建工程)、compile(编译代码)、test(运行测试)、deploy(部署)、analysis(代码分析)、mixed(混合模式)",
+            "required": False,
+            "default": "mixed"
+        },
+        "speed": {
+            "type": "string",
+            "description": "输出速度：fast(快速)、normal(正常)、slow(慢速)",
+            "required": False,
+            "default": "normal"
+        },
+        "intensity": {
+            "type": "string",
+            "description": "忙碌程度：low(轻松)、normal(正常)、high(高强度)",
+            "required": False,
+            "default": "normal"
+        }
+    }
+}
+
+_BREAK_MESSAGES = (
+    "\n☕ 短暂休息，准备下一个任务...",
+    "\n🔄 正在切换工作环境...",
+    "\n📝 正在更新项目文档...",
+    "\n🔧 正在优化系统配置...",
+    "\n💾 正在保存工作进度...",
+    "\n🌐 正在同步远程仓库...",
+    "\n🧹 正在清理临时文件..."
+)
+
+
 class FakeWorkTool(BaseTool):
     """假装工作工具类"""
-    
+
+    # 进度条一共只有41种形态，预先生成好按填充长度取用
+    _BAR_LENGTH = 40
+    _BARS = tuple('█' * i + '░' * (40 - i) for i in range(41))
+    _HEADER_LINE = "=" * 80
+    _SEPARATOR_LINE = "=" * 60
+
     def __init__(self):
         super().__init__()
-        self.stop_flag = False
-        self.total_duration = 0
-        self.start_time = None
+        self._stop_event = threading.Event()
+        self._deadline = None
+        self._start_monotonic = None
+        self._hash_pool = []
         
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "fake_work_tool",
-            "description": "假装在工作的工具，模拟各种开发任务，让命令行看起来很忙碌",
-            "parameters": {
-                "duration": {
-                    "type": "int",
-                    "description": "持续时间（分钟），默认30分钟",
-                    "required": False,
-                    "default": 30
-                },
-                "scenario": {
-                    "type": "string",
-                    "description": "工作场景：cmake(构建工程)、compile(编译代码)、test(运行测试)、deploy(部署)、analysis(代码分析)、mixed(混合模式)",
-                    "required": False,
-                    "default": "mixed"
-                },
-                "speed": {
-                    "type": "string",
-                    "description": "输出速度：fast(快速)、normal(正常)、slow(慢速)",
-                    "required": False,
-                    "default": "normal"
-                },
-                "intensity": {
-                    "type": "string",
-                    "description": "忙碌程度：low(轻松)、normal(正常)、high(高强度)",
-                    "required": False,
-                    "default": "normal"
-                }
-            }
-        }
+        return _DESCRIPTION
     
     def execute(self, args: Dict[str, Any]) -> str:
         """执行假装工作"""
@@ -84,37 +187,82 @@ class FakeWorkTool(BaseTool):
             raise ValueError(f"不支持的强度: {intensity}")
         
         try:
-            # 设置参数
-            self.total_duration = duration * 60  # 转换为秒
-            self.start_time = datetime.now()
-            
+            # 设置参数。起点和截止点都用单调时钟记录
+            self._start_monotonic = time.monotonic()
+            self._deadline = self._start_monotonic + duration * 60
+            self._stop_event.clear()
+
             # 清屏并开始假装工作
             self._clear_screen()
             self._print_header(duration, scenario)
-            
-            # 设置键盘中断处理
+
+            # Ctrl+C置位停止事件，各层循环在等待中立即醒来收尾；
+            # 非主线程装不了信号处理器时退回KeyboardInterrupt
+            previous_handler = None
+            try:
+                previous_handler = signal.signal(
+                    signal.SIGINT, lambda signum, frame: self._stop_event.set())
+            except ValueError:
+                pass
+
             try:
                 self._start_fake_work(scenario, speed, intensity)
             except KeyboardInterrupt:
+                self._stop_event.set()
+            finally:
+                if previous_handler is not None:
+                    signal.signal(signal.SIGINT, previous_handler)
+
+            if self._stop_event.is_set():
                 self._print_exit_message()
                 #return "\n\n🎭 假装工作已停止，记得保存您的\"成果\"！"
-            
-            self._print_completion_message()
-            #return f"\n\n🎉 恭喜！您已经\"工作\"了 {duration} 分钟！\n💼 今天的工作表现非常出色！"
-            
+            else:
+                self._print_completion_message()
+                #return f"\n\n🎉 恭喜！您已经\"工作\"了 {duration} 分钟！\n💼 今天的工作表现非常出色！"
+
         except Exception as e:
             #return f"假装工作失败: {str(e)}"
             pass
     
+    # Windows控制台ANSI支持的检测结果，整个进程只检测一次
+    _vt_enabled_cache = None
+
+    @classmethod
+    def _vt_enabled(cls) -> bool:
+        """尝试为Windows控制台开启ANSI转义处理，结果缓存在类上"""
+        if cls._vt_enabled_cache is None:
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+                mode = ctypes.c_uint32()
+                if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                    # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                    cls._vt_enabled_cache = bool(
+                        kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+                else:
+                    cls._vt_enabled_cache = False
+            except Exception:
+                cls._vt_enabled_cache = False
+        return cls._vt_enabled_cache
+
     def _clear_screen(self):
-        """清屏"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """清屏
+
+        直接写ANSI清屏序列，省掉os.system起子进程的开销；
+        老版本Windows控制台不认ANSI时退回cls命令。
+        """
+        if os.name == 'nt' and not self._vt_enabled():
+            os.system('cls')
+            return
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
     
     def _print_header(self, duration: int, scenario: str):
         """打印标题信息"""
-        print("=" * 80)
+        print(self._HEADER_LINE)
         print("💡 提示: 按 Ctrl+C 可随时停止")
-        print("=" * 80)
+        print(self._HEADER_LINE)
         print()
         time.sleep(2)
     
@@ -128,20 +276,9 @@ class FakeWorkTool(BaseTool):
         }
         
         min_interval, max_interval = speed_intervals[speed]
-        
-        # 工作场景循环
-        scenarios = [scenario] if scenario != 'mixed' else ['cmake', 'compile', 'test', 'deploy', 'analysis']
-        
-        while not self._is_time_up():
-            current_scenario = random.choice(scenarios)
-            self._run_scenario(current_scenario, min_interval, max_interval, intensity)
-            
-            if not self._is_time_up():
-                self._show_break_message()
-                time.sleep(random.uniform(2, 5))
-    
-    def _run_scenario(self, scenario: str, min_interval: float, max_interval: float, intensity: str):
-        """运行特定场景"""
+
+        # 把场景方法预先绑定成元组，循环里按下标取，
+        # 省去每轮按场景名做字典查找的中转
         scenario_methods = {
             'cmake': self._cmake_scenario,
             'compile': self._compile_scenario,
@@ -149,51 +286,84 @@ class FakeWorkTool(BaseTool):
             'deploy': self._deploy_scenario,
             'analysis': self._analysis_scenario
         }
-        
-        if scenario in scenario_methods:
-            scenario_methods[scenario](min_interval, max_interval, intensity)
+        if scenario == 'mixed':
+            methods = tuple(scenario_methods.values())
+        else:
+            methods = (scenario_methods[scenario],)
+
+        while not self._should_stop():
+            methods[random.randrange(len(methods))](min_interval, max_interval, intensity)
+
+            if not self._should_stop():
+                self._show_break_message()
+                self._stop_event.wait(random.uniform(2, 5))
     
+    def _emit(self, lines: List[str]):
+        """一次写出一批输出行
+
+        逐条print每行都会走一次格式化和缓冲写入；
+        把同一轮产生的几行合成一次sys.stdout.write，减少输出路径开销。
+        """
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
     def _cmake_scenario(self, min_interval: float, max_interval: float, intensity: str):
         """CMake构建场景"""
-        print(f"🔨 开始CMake构建...")
-        print("-- The C compiler identification is GNU 11.4.0")
-        print("-- The CXX compiler identification is GNU 11.4.0")
-        print("-- Detecting C compiler ABI info")
-        print("-- Detecting C compiler ABI info - done")
+        self._emit([
+            "🔨 开始CMake构建...",
+            "-- The C compiler identification is GNU 11.4.0",
+            "-- The CXX compiler identification is GNU 11.4.0",
+            "-- Detecting C compiler ABI info",
+            "-- Detecting C compiler ABI info - done",
+        ])
         time.sleep(random.uniform(min_interval, max_interval))
         
-        projects = ['CoreEngine', 'NetworkModule', 'DatabaseLayer', 'UIFramework', 'MathUtils']
-        
-        for i in range(random.randint(15, 35)):
-            if self._is_time_up():
-                break
-                
-            project = random.choice(projects)
-            action = random.choice([
-                'Configuring', 'Building', 'Linking', 'Generating', 'Installing'
-            ])
-            
-            file_types = ['.cpp', '.h', '.cmake', '.proto', '.cc']
-            filename = f"{random.choice(['main', 'utils', 'config', 'handler', 'service'])}{random.choice(file_types)}"
-            
-            print(f"-- {action} {project}/{filename}")
-            
-            # 随机显示一些详细信息
+        # 一次批量抽取本轮所有随机文案，省去循环内逐次的random.choice调用
+        total = random.randint(15, 35)
+        projects = random.choices(_PROJECTS, k=total)
+        actions = random.choices(_CMAKE_ACTIONS, k=total)
+        file_names = random.choices(_CMAKE_FILE_NAMES, k=total)
+        file_types = random.choices(_CMAKE_FILE_TYPES, k=total)
+
+        line_buffer = []
+        pending_sleep = 0.0
+        for i in range(total):
+            project = projects[i]
+            action = actions[i]
+            filename = f"{file_names[i]}{file_types[i]}"
+
+            line_buffer.append(f"-- {action} {project}/{filename}")
+
+            # 随机显示一些详细信息（先选种类，只构建选中的那条）
             if random.random() < 0.3:
-                details = [
-                    f"   Found dependency: {random.choice(['OpenSSL', 'Boost', 'Qt5', 'gRPC', 'Protobuf'])}",
-                    f"   Linking target: lib{project.lower()}.so",
-                    f"   Generated: {random.randint(50, 500)} object files",
-                    f"   Memory usage: {random.randint(128, 2048)}MB"
-                ]
-                print(random.choice(details))
-            
-            time.sleep(random.uniform(min_interval, max_interval))
-            
-            # 随机显示进度条
-            if i % random.randint(8, 15) == 0:
+                kind = random.randrange(4)
+                if kind == 0:
+                    line_buffer.append(f"   Found dependency: {random.choice(_CMAKE_DEPENDENCIES)}")
+                elif kind == 1:
+                    line_buffer.append(f"   Linking target: lib{project.lower()}.so")
+                elif kind == 2:
+                    line_buffer.append(f"   Generated: {random.randint(50, 500)} object files")
+                else:
+                    line_buffer.append(f"   Memory usage: {random.randint(128, 2048)}MB")
+
+            # 攒下本行的间隔，攒够一批后一次写出、一次睡够，
+            # 超时检查也按批做而不是每行做
+            pending_sleep += random.uniform(min_interval, max_interval)
+            if len(line_buffer) >= 4:
+                self._emit(line_buffer)
+                if self._should_stop() or self._stop_event.wait(pending_sleep):
+                    break
+                pending_sleep = 0.0
+
+            # 显示进度条。间隔固定为2的幂，按位与比取模便宜，
+            # 还省掉原来每轮一次的random.randint
+            if (i & 7) == 0:
+                if line_buffer:
+                    self._emit(line_buffer)
                 self._show_progress_bar(f"Building {project}", i, 30, random.randint(40, 90))
-        
+
+        if line_buffer:
+            self._emit(line_buffer)
         print("-- Build files have been written to: /build")
         print("✅ CMake配置完成!")
     
@@ -201,112 +371,94 @@ class FakeWorkTool(BaseTool):
         """编译场景"""
         print("🔄 开始编译项目...")
         
-        languages = ['C++', 'Python', 'Java', 'Go', 'Rust']
-        current_lang = random.choice(languages)
+        current_lang = random.choice(_LANGUAGES)
         print(f"📝 编译语言: {current_lang}")
-        
-        for i in range(random.randint(20, 40)):
-            if self._is_time_up():
-                break
-                
-            # 生成随机文件路径
-            dirs = ['src', 'lib', 'core', 'utils', 'modules', 'services']
-            files = ['main', 'handler', 'parser', 'validator', 'controller', 'model']
-            extensions = {
-                'C++': ['.cpp', '.cc', '.cxx'],
-                'Python': ['.py'],
-                'Java': ['.java'],
-                'Go': ['.go'],
-                'Rust': ['.rs']
-            }
-            
-            dir_name = random.choice(dirs)
-            file_name = random.choice(files)
-            ext = random.choice(extensions[current_lang])
-            full_path = f"{dir_name}/{file_name}{ext}"
-            
-            # 编译输出
-            compiler_commands = {
-                'C++': f"g++ -O2 -std=c++17 -c {full_path}",
-                'Python': f"python -m py_compile {full_path}",
-                'Java': f"javac -cp ./lib/* {full_path}",
-                'Go': f"go build {full_path}",
-                'Rust': f"rustc --edition 2021 {full_path}"
-            }
-            
-            print(f"[{i+1:3d}/40] {compiler_commands[current_lang]}")
-            
+
+        lang_extensions = _EXTENSIONS[current_lang]
+        line_template = _COMPILE_LINE_TEMPLATES[current_lang]
+
+        # 批量抽取随机文件路径的各个部分
+        total = random.randint(20, 40)
+        dir_names = random.choices(_SRC_DIRS, k=total)
+        file_names = random.choices(_SRC_FILES, k=total)
+        exts = random.choices(lang_extensions, k=total)
+
+        line_buffer = []
+        pending_sleep = 0.0
+        for i in range(total):
+            # 编译输出，序号和文件路径一次性填进预拼好的整行模板
+            line_buffer.append(line_template.format(i=i + 1, dir=dir_names[i],
+                                                    file=file_names[i], ext=exts[i]))
+
             # 随机显示编译警告或信息
             if random.random() < 0.15:
-                warnings = [
-                    "warning: unused variable 'temp'",
-                    "warning: implicit conversion from double to int",
-                    "info: optimization level set to O2",
-                    "note: including precompiled headers"
-                ]
-                print(f"         {random.choice(warnings)}")
-            
-            time.sleep(random.uniform(min_interval, max_interval))
-            
-            # 显示编译进度
-            if i % 10 == 9:
+                line_buffer.append(f"         {random.choice(_COMPILE_WARNINGS)}")
+
+            pending_sleep += random.uniform(min_interval, max_interval)
+            if len(line_buffer) >= 4:
+                self._emit(line_buffer)
+                if self._should_stop() or self._stop_event.wait(pending_sleep):
+                    break
+                pending_sleep = 0.0
+
+            # 显示编译进度，间隔取2的幂用按位与判断
+            if (i & 15) == 15:
+                if line_buffer:
+                    self._emit(line_buffer)
                 self._show_progress_bar("Compiling", i+1, 40, random.randint(60, 95))
-        
+
+        if line_buffer:
+            self._emit(line_buffer)
         print("✅ 编译完成! 生成了可执行文件。")
     
     def _test_scenario(self, min_interval: float, max_interval: float, intensity: str):
         """测试场景"""
         print("🧪 运行自动化测试...")
         
-        test_suites = ['unit_tests', 'integration_tests', 'e2e_tests', 'performance_tests']
-        
-        for suite in test_suites:
-            if self._is_time_up():
+        for suite in _TEST_SUITES:
+            if self._should_stop():
                 break
                 
             print(f"\n📋 运行测试套件: {suite}")
             total_tests = random.randint(25, 80)
+            test_names = random.choices(_TEST_NAMES, k=total_tests)
+            # 通过/失败、是否带错误详情、耗时也一次批量抽好，
+            # 循环里不再逐条调用random
+            pass_flags = random.choices((True, False), cum_weights=(88, 100), k=total_tests)
+            error_flags = random.choices((True, False), cum_weights=(50, 100), k=total_tests)
+            latencies = random.choices(range(5, 151), k=total_tests)
             passed = 0
             failed = 0
-            
+
+            line_buffer = []
+            pending_sleep = 0.0
             for i in range(total_tests):
-                if self._is_time_up():
-                    break
-                    
-                test_names = [
-                    'test_user_authentication',
-                    'test_database_connection',
-                    'test_api_response_time',
-                    'test_data_validation',
-                    'test_error_handling',
-                    'test_memory_leak',
-                    'test_concurrent_access',
-                    'test_security_headers'
-                ]
-                
-                test_name = random.choice(test_names)
-                
+                test_name = test_names[i]
+
                 # 大多数测试通过
-                if random.random() < 0.88:
-                    print(f"✅ {test_name} ... PASSED ({random.randint(5, 150)}ms)")
+                if pass_flags[i]:
+                    line_buffer.append(f"✅ {test_name} ... PASSED ({latencies[i]}ms)")
                     passed += 1
                 else:
-                    print(f"❌ {test_name} ... FAILED")
+                    line_buffer.append(f"❌ {test_name} ... FAILED")
                     failed += 1
-                    if random.random() < 0.5:
-                        error_msgs = [
-                            "    AssertionError: Expected 200, got 404",
-                            "    TimeoutError: Connection timeout after 5s",
-                            "    ValueError: Invalid input parameter",
-                            "    DatabaseError: Connection refused"
-                        ]
-                        print(random.choice(error_msgs))
-                
-                time.sleep(random.uniform(min_interval * 0.5, max_interval * 0.5))
-                
-                if i % 15 == 14:
+                    if error_flags[i]:
+                        line_buffer.append(random.choice(_TEST_ERROR_MSGS))
+
+                pending_sleep += random.uniform(min_interval * 0.5, max_interval * 0.5)
+                if len(line_buffer) >= 4:
+                    self._emit(line_buffer)
+                    if self._should_stop() or self._stop_event.wait(pending_sleep):
+                        break
+                    pending_sleep = 0.0
+
+                if (i & 15) == 15:
+                    if line_buffer:
+                        self._emit(line_buffer)
                     self._show_progress_bar(f"Testing {suite}", i+1, total_tests, random.randint(70, 95))
-            
+
+            if line_buffer:
+                self._emit(line_buffer)
             print(f"\n📊 {suite} 结果: {passed} 通过, {failed} 失败")
         
         print(f"\n🎯 测试总结: 总体通过率 {random.randint(85, 98)}%")
@@ -315,49 +467,37 @@ class FakeWorkTool(BaseTool):
         """部署场景"""
         print("🚀 开始自动化部署...")
         
-        environments = ['staging', 'production', 'testing']
-        env = random.choice(environments)
+        env = random.choice(_ENVIRONMENTS)
         
         print(f"🌍 目标环境: {env}")
         print(f"🔧 Docker版本: {random.randint(20, 24)}.{random.randint(1, 12)}.{random.randint(0, 9)}")
         print(f"☸️  Kubernetes版本: 1.{random.randint(25, 29)}.{random.randint(0, 15)}")
         
-        deployment_steps = [
-            ("准备Docker镜像", "docker build -t app:latest ."),
-            ("推送镜像到仓库", "docker push registry.company.com/app:latest"),
-            ("更新Kubernetes配置", "kubectl apply -f deployment.yaml"),
-            ("执行数据库迁移", "python manage.py migrate"),
-            ("更新配置文件", "kubectl create configmap app-config"),
-            ("滚动更新服务", "kubectl rollout restart deployment/app"),
-            ("等待Pod就绪", "kubectl wait --for=condition=ready pod"),
-            ("运行健康检查", "curl -f http://app/health"),
-            ("更新负载均衡", "kubectl patch service app"),
-            ("清理旧版本", "docker system prune -f")
-        ]
-        
-        for i, (step_name, command) in enumerate(deployment_steps):
-            if self._is_time_up():
+        for i, (step_name, command) in enumerate(_DEPLOYMENT_STEPS):
+            if self._should_stop():
                 break
                 
-            print(f"\n[{i+1:2d}/10] {step_name}...")
-            print(f"        $ {command}")
-            
+            lines = [f"\n[{i+1:2d}/10] {step_name}...",
+                     f"        $ {command}"]
+
             # 模拟命令输出
             if 'docker' in command:
-                print(f"        Sending build context to Docker daemon  {random.randint(10, 500)}MB")
-                print(f"        Successfully built {self._random_hash()}")
+                lines.append(f"        Sending build context to Docker daemon  {random.randint(10, 500)}MB")
+                lines.append(f"        Successfully built {self._random_hash()}")
             elif 'kubectl' in command:
-                print(f"        deployment.apps/app {'created' if random.random() < 0.5 else 'configured'}")
+                lines.append(f"        deployment.apps/app {'created' if random.random() < 0.5 else 'configured'}")
             elif 'migrate' in command:
                 migrations = random.randint(0, 8)
                 if migrations > 0:
-                    print(f"        Running {migrations} migrations:")
+                    lines.append(f"        Running {migrations} migrations:")
                     for j in range(migrations):
-                        print(f"          Applying migration {j+1:04d}... OK")
+                        lines.append(f"          Applying migration {j+1:04d}... OK")
                 else:
-                    print("        No migrations to apply.")
-            
-            time.sleep(random.uniform(min_interval, max_interval * 2))
+                    lines.append("        No migrations to apply.")
+
+            self._emit(lines)
+            if self._stop_event.wait(random.uniform(min_interval, max_interval * 2)):
+                break
             
             if i % 3 == 2:
                 self._show_progress_bar("Deploying", i+1, 10, random.randint(75, 100))
@@ -369,21 +509,12 @@ class FakeWorkTool(BaseTool):
         """代码分析场景"""
         print("🔍 开始代码质量分析...")
         
-        tools = ['SonarQube', 'ESLint', 'PyLint', 'SpotBugs', 'CodeClimate']
-        current_tool = random.choice(tools)
-        
+        current_tool = random.choice(_ANALYSIS_TOOLS)
+
         print(f"🛠️  分析工具: {current_tool}")
-        
-        analysis_types = [
-            ("静态代码分析", "正在扫描代码质量问题..."),
-            ("安全漏洞检查", "正在检查潜在安全风险..."),
-            ("性能分析", "正在分析性能瓶颈..."),
-            ("代码重复检测", "正在检测重复代码..."),
-            ("依赖关系分析", "正在分析项目依赖...")
-        ]
-        
-        for analysis_name, description in analysis_types:
-            if self._is_time_up():
+
+        for analysis_name, description in _ANALYSIS_TYPES:
+            if self._should_stop():
                 break
                 
             print(f"\n📊 {analysis_name}")
@@ -392,25 +523,26 @@ class FakeWorkTool(BaseTool):
             files_to_analyze = random.randint(50, 200)
             
             for i in range(files_to_analyze):
-                if self._is_time_up():
+                if self._should_stop():
                     break
                     
-                if i % 20 == 0:
-                    file_path = f"src/{random.choice(['controllers', 'models', 'utils', 'services'])}/{random.choice(['user', 'auth', 'data', 'config'])}.py"
+                if (i & 15) == 0:
+                    file_path = f"src/{random.choice(_ANALYSIS_SRC_DIRS)}/{random.choice(_ANALYSIS_SRC_FILES)}.py"
                     print(f"     正在分析: {file_path}")
-                
-                time.sleep(random.uniform(min_interval * 0.3, max_interval * 0.3))
-                
-                if i % 25 == 24:
+
+                if self._stop_event.wait(random.uniform(min_interval * 0.3, max_interval * 0.3)):
+                    break
+
+                if (i & 31) == 31:
                     self._show_progress_bar(analysis_name, i+1, files_to_analyze, random.randint(60, 90))
             
             # 分析结果
             issues = random.randint(0, 15)
             if issues > 0:
-                print(f"     ⚠️  发现 {issues} 个问题")
-                issue_types = ['代码异味', '安全风险', '性能问题', '重复代码', '复杂度过高']
+                lines = [f"     ⚠️  发现 {issues} 个问题"]
                 for _ in range(min(issues, 3)):
-                    print(f"       - {random.choice(issue_types)}: 第{random.randint(1, 500)}行")
+                    lines.append(f"       - {random.choice(_ISSUE_TYPES)}: 第{random.randint(1, 500)}行")
+                self._emit(lines)
             else:
                 print(f"     ✅ 未发现问题")
         
@@ -419,55 +551,61 @@ class FakeWorkTool(BaseTool):
     
     def _show_progress_bar(self, task: str, current: int, total: int, percentage: int):
         """显示进度条"""
-        bar_length = 40
-        filled_length = int(bar_length * percentage // 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        
-        elapsed = datetime.now() - self.start_time
-        elapsed_str = str(elapsed).split('.')[0]
-        
-        print(f"\n[{bar}] {percentage:3d}% | {task} ({current}/{total}) | 运行时间: {elapsed_str}")
-        time.sleep(random.uniform(1, 3))
+        filled_length = self._BAR_LENGTH * percentage // 100
+        bar = self._BARS[filled_length]
+
+        # 直接用单调时钟算运行秒数并divmod格式化，
+        # 不再做datetime减法加字符串切分
+        elapsed = int(time.monotonic() - self._start_monotonic)
+        hours, rem = divmod(elapsed, 3600)
+        minutes, seconds = divmod(rem, 60)
+
+        print(f"\n[{bar}] {percentage:3d}% | {task} ({current}/{total}) | 运行时间: {hours}:{minutes:02d}:{seconds:02d}")
+        self._stop_event.wait(random.uniform(1, 3))
     
     def _show_break_message(self):
         """显示休息信息"""
-        break_messages = [
-            "\n☕ 短暂休息，准备下一个任务...",
-            "\n🔄 正在切换工作环境...",
-            "\n📝 正在更新项目文档...",
-            "\n🔧 正在优化系统配置...",
-            "\n💾 正在保存工作进度...",
-            "\n🌐 正在同步远程仓库...",
-            "\n🧹 正在清理临时文件..."
-        ]
-        
-        print(random.choice(break_messages))
+        print(random.choice(_BREAK_MESSAGES))
     
     def _random_hash(self) -> str:
-        """生成随机哈希"""
-        chars = 'abcdef0123456789'
-        return ''.join(random.choice(chars) for _ in range(12))
+        """生成随机哈希
+
+        一次os.urandom取够64个哈希的随机字节切成池，用完再补，
+        把取随机数的系统调用摊薄到64次使用上。
+        """
+        pool = self._hash_pool
+        if not pool:
+            digits = os.urandom(64 * 6).hex()
+            pool.extend(digits[i:i + 12] for i in range(0, len(digits), 12))
+        return pool.pop()
     
+    def _should_stop(self) -> bool:
+        """时间到或收到停止信号都算结束"""
+        return self._stop_event.is_set() or self._is_time_up()
+
     def _is_time_up(self) -> bool:
-        """检查时间是否到了"""
-        if self.start_time is None:
+        """检查时间是否到了
+
+        内层循环每轮都会调用，用time.monotonic()和预先算好的
+        截止点比较，避免每次构造datetime和timedelta对象。
+        """
+        if self._deadline is None:
             return False
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        return elapsed >= self.total_duration
+        return time.monotonic() >= self._deadline
     
     def _print_exit_message(self):
         """打印退出信息"""
-        elapsed = datetime.now() - self.start_time
-        elapsed_minutes = int(elapsed.total_seconds() // 60)
-        
-        print("\n" + "="*60)
-        print("="*60)
-    
+        elapsed = time.monotonic() - self._start_monotonic
+        elapsed_minutes = int(elapsed // 60)
+
+        print("\n" + self._SEPARATOR_LINE)
+        print(self._SEPARATOR_LINE)
+
     def _print_completion_message(self):
         """打印完成信息"""
-        print("\n" + "="*60)
-        
-        print("="*60)
+        print("\n" + self._SEPARATOR_LINE)
+
+        print(self._SEPARATOR_LINE)
 
 
 # 实例化工具
@@ -5,49 +5,102 @@
 提供各种有趣的在线API功能，如笑话、名言、冷知识等
 """
 
-import requests
 import json
 import sys
-import webbrowser
-import subprocess
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from tool_base import BaseTool
 
+# orjson解析JSON比标准库快数倍，装了就用，没装退回标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 响应缓存文件及各主机的过期时间（秒）。
+# 只缓存这里明确列出的主机：NASA每日图片一天内不变，名言类
+# 分钟级过期即可；随机图片/随机知识类接口每次都应返回新结果，
+# 不在表里的主机一律不缓存
+_CACHE_FILENAME = '.fun_api_cache.json'
+_CACHE_TTLS = {
+    'api.nasa.gov': 86400,
+    'api.quotable.io': 60,
+    'v2.jokeapi.dev': 60,
+}
+
+# 工具描述只读不改，构建一次供get_description直接返回
+_DESCRIPTION = {
+    "name": "fun_api_tool",
+    "description": "调用各种有趣的免费API，获取笑话、名言、冷知识、可爱动物图片等",
+    "parameters": {
+        "service": {
+            "type": "string",
+            "description": "要调用的服务类型：joke(笑话)、quote(名言)、catfact(猫咪知识)、dogimage(狗狗图片)、catimage(猫咪图片)、nasa(NASA每日图片)、uselessfact(无用知识)、advice(人生建议)、chucknorris(查克·诺里斯笑话)，可用逗号分隔同时调用多个",
+            "required": True
+        },
+        "language": {
+            "type": "string",
+            "description": "语言偏好：en(英文)、cn(中文，仅部分API支持)",
+            "required": False,
+            "default": "en"
+        },
+        "category": {
+            "type": "string",
+            "description": "分类过滤（仅部分API支持），如：programming、misc、dark等",
+            "required": False
+        },
+        "show": {
+            "type": "bool",
+            "description": "对于图片类服务，是否在浏览器中直接显示图片",
+            "required": False,
+            "default": False
+        },
+        "use_cache": {
+            "type": "bool",
+            "description": "是否使用本地响应缓存，短时间内重复调用同一接口直接返回缓存结果",
+            "required": False,
+            "default": True
+        }
+    }
+}
+
 
 class FunApiTool(BaseTool):
     """有趣API工具类"""
-    
+
+    def __init__(self):
+        super().__init__()
+        # Session推迟到第一次请求时创建，导入本模块（比如工具发现时
+        # 只读描述）就不用加载requests及其一串依赖
+        self._session = None
+        # 服务映射，execute和execute_many共用
+        self._api_functions = {
+            'joke': self._get_joke,
+            'quote': self._get_quote,
+            'catfact': self._get_cat_fact,
+            'dogimage': self._get_dog_image,
+            'catimage': self._get_cat_image,
+            'nasa': self._get_nasa_apod,
+            'uselessfact': self._get_useless_fact,
+            'advice': self._get_advice,
+            'chucknorris': self._get_chuck_norris_joke
+        }
+        self._cache_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), _CACHE_FILENAME)
+        self._cache = None
+        # execute_many的工作线程会并发读写缓存字典和缓存文件，
+        # 加载/过期清理/插入/落盘整段都在锁内完成
+        self._cache_lock = threading.Lock()
+        self._use_cache = True
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "fun_api_tool",
-            "description": "调用各种有趣的免费API，获取笑话、名言、冷知识、可爱动物图片等",
-            "parameters": {
-                "service": {
-                    "type": "string",
-                    "description": "要调用的服务类型：joke(笑话)、quote(名言)、catfact(猫咪知识)、dogimage(狗狗图片)、catimage(猫咪图片)、nasa(NASA每日图片)、uselessfact(无用知识)、advice(人生建议)、chucknorris(查克·诺里斯笑话)",
-                    "required": True
-                },
-                "language": {
-                    "type": "string", 
-                    "description": "语言偏好：en(英文)、cn(中文，仅部分API支持)",
-                    "required": False,
-                    "default": "en"
-                },
-                "category": {
-                    "type": "string",
-                    "description": "分类过滤（仅部分API支持），如：programming、misc、dark等",
-                    "required": False
-                },
-                "show": {
-                    "type": "bool",
-                    "description": "对于图片类服务，是否在浏览器中直接显示图片",
-                    "required": False,
-                    "default": False
-                }
-            }
-        }
+        return _DESCRIPTION
     
     def execute(self, args: Dict[str, Any]) -> str:
         """执行API调用"""
@@ -58,42 +111,131 @@ class FunApiTool(BaseTool):
         language = args.get('language', 'en').lower()
         category = args.get('category', '')
         show = args.get('show', False)
-        
-        # 服务映射
-        api_functions = {
-            'joke': self._get_joke,
-            'quote': self._get_quote,
-            'catfact': self._get_cat_fact,
-            'dogimage': self._get_dog_image,
-            'catimage': self._get_cat_image,
-            'nasa': self._get_nasa_apod,
-            'uselessfact': self._get_useless_fact,
-            'advice': self._get_advice,
-            'chucknorris': self._get_chuck_norris_joke
-        }
-        
-        if service not in api_functions:
-            available_services = ', '.join(api_functions.keys())
+        self._use_cache = bool(args.get('use_cache', True))
+
+        # 逗号分隔多个服务时并发调用
+        services = [s.strip() for s in service.split(',') if s.strip()]
+        if len(services) > 1:
+            return '\n\n'.join(self.execute_many(services, language, category, show))
+
+        if service not in self._api_functions:
+            available_services = ', '.join(self._api_functions.keys())
             raise ValueError(f"不支持的服务类型: {service}。可用服务: {available_services}")
-        
+
         try:
-            return api_functions[service](language, category, show)
+            return self._api_functions[service](language, category, show)
         except Exception as e:
             return f"API调用失败: {str(e)}"
+
+    def execute_many(self, services: List[str], language: str = 'en',
+                     category: str = '', show: bool = False) -> List[str]:
+        """并发调用多个服务
+
+        各服务的API请求互相独立，用线程池同时发起，
+        总耗时取决于最慢的一个而不是所有请求之和。
+        """
+        unknown = [s for s in services if s not in self._api_functions]
+        if unknown:
+            available_services = ', '.join(self._api_functions.keys())
+            raise ValueError(f"不支持的服务类型: {', '.join(unknown)}。可用服务: {available_services}")
+
+        def call_one(service: str) -> str:
+            try:
+                return self._api_functions[service](language, category, show)
+            except Exception as e:
+                return f"API调用失败: {str(e)}"
+
+        with ThreadPoolExecutor(max_workers=min(8, len(services))) as executor:
+            return list(executor.map(call_one, services))
     
+    def _load_cache(self) -> Dict:
+        """惰性加载磁盘缓存，文件缺失或损坏时从空缓存开始"""
+        if self._cache is None:
+            try:
+                with open(self._cache_path, 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self):
+        """原子写回磁盘缓存，写失败时只是下次重新请求，不影响结果"""
+        tmp_path = self._cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, ensure_ascii=False)
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _cache_ttl(url: str) -> int:
+        """按主机取缓存过期时间，未登记的主机返回0表示不缓存"""
+        try:
+            host = url.split('/', 3)[2]
+        except IndexError:
+            host = ''
+        return _CACHE_TTLS.get(host, 0)
+
+    def _ensure_session(self):
+        """首次请求时创建带连接池和重试的Session
+
+        复用同一个Session，对同一批API主机保持keep-alive连接，
+        避免每次调用都重新建立TCP/TLS连接。
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+            session = requests.Session()
+            session.headers.update({'User-Agent': 'windows_tools/1.0'})
+            retry = Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
     def _make_request(self, url: str, headers: Optional[Dict] = None, timeout: int = 10) -> Dict:
-        """发起HTTP请求"""
+        """发起HTTP请求，登记过TTL的幂等接口按URL缓存到磁盘"""
+        import requests  # 首次调用后走的是sys.modules缓存
+
+        ttl = self._cache_ttl(url)
+        use_cache = self._use_cache and ttl > 0
+
+        if use_cache:
+            with self._cache_lock:
+                entry = self._load_cache().get(url)
+            if entry is not None and time.time() - entry['time'] < ttl:
+                return entry['data']
+
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self._ensure_session().get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            data = _json_loads(response.content)
         except requests.exceptions.RequestException as e:
             raise Exception(f"网络请求失败: {e}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise Exception(f"JSON解析失败: {e}")
+
+        if use_cache:
+            now = time.time()
+            with self._cache_lock:
+                cache = self._load_cache()
+                # 顺手清掉已过期的条目，避免缓存文件无限增长
+                for cached_url in [u for u, v in cache.items()
+                                   if now - v['time'] >= self._cache_ttl(u)]:
+                    del cache[cached_url]
+                cache[url] = {'time': now, 'data': data}
+                self._save_cache()
+        return data
     
     def _open_in_browser(self, url: str) -> str:
         """在浏览器中打开URL"""
+        import webbrowser
+        import subprocess
+
         try:
             # 方法1：使用webbrowser模块
             webbrowser.open(url)
@@ -5,56 +5,226 @@
 计算距离下次法定节假日还有多久
 """
 
-import requests
 import json
 import sys
 import os
-from datetime import datetime, timedelta, date
+import time
+import bisect
+from datetime import date
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from tool_base import BaseTool
 
+# 优先使用orjson解析API返回，整年节假日数据有几十KB，
+# C实现的解析器明显更快；未安装时回退标准库，不引入硬依赖
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 节假日数据一年只变动几次，API结果按年份缓存一天：
+# 进程内用字典，跨进程用模块旁的JSON文件
+_CACHE_FILENAME = '.holiday_cache.json'
+_CACHE_TTL = 86400
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), _CACHE_FILENAME)
+_HOLIDAY_CACHE: Dict[int, tuple] = {}
+
+# 星期几的显示名，提升到模块级避免每次格式化时重建列表
+_WEEKDAYS = ('周一', '周二', '周三', '周四', '周五', '周六', '周日')
+
+# 分隔线常量，省去每次格式化时的字符串乘法
+_SEP30 = "=" * 30
+_SEP40 = "=" * 40
+
+# 参数合法值，常量化省去每次调用重建列表做线性查找
+_VALID_SOURCES = frozenset(('api', 'local'))
+_VALID_FORMATS = frozenset(('simple', 'detailed'))
+
+# 进程内共享的HTTP会话，懒初始化
+_SESSION = None
+
+
+def _get_session():
+    """返回带连接池和重试的共享Session
+
+    工具服务器模式下同一进程会反复调用，复用keep-alive连接
+    省去每次请求的TCP/TLS握手；一次性CLI调用也受益于重试策略。
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _cache_get(year: int) -> Optional[List[Dict]]:
+    """读取未过期的年度缓存，进程内优先，其次磁盘文件"""
+    now = time.time()
+    entry = _HOLIDAY_CACHE.get(year)
+    if entry is not None and now - entry[0] < _CACHE_TTL:
+        return entry[1]
+    try:
+        with open(_CACHE_PATH, 'r', encoding='utf-8') as f:
+            disk_entry = json.load(f).get(str(year))
+    except (OSError, ValueError):
+        return None
+    if disk_entry and now - disk_entry.get('fetched_at', 0) < _CACHE_TTL:
+        _HOLIDAY_CACHE[year] = (disk_entry['fetched_at'], disk_entry['data'])
+        return disk_entry['data']
+    return None
+
+
+def _cache_set(year: int, holidays: List[Dict]) -> None:
+    """写入进程内缓存并原子更新磁盘文件，写盘失败不影响结果"""
+    now = time.time()
+    _HOLIDAY_CACHE[year] = (now, holidays)
+    try:
+        with open(_CACHE_PATH, 'r', encoding='utf-8') as f:
+            disk = json.load(f)
+    except (OSError, ValueError):
+        disk = {}
+    disk[str(year)] = {'fetched_at': now, 'data': holidays}
+    tmp_path = _CACHE_PATH + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(disk, f, ensure_ascii=False)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+
+
+# 固定日期的节假日 (月, 日, 名称)，需要根据实际情况更新
+_FIXED_HOLIDAYS = (
+    (1, 1, '元旦'),
+    (4, 4, '清明节'),
+    (4, 5, '清明节'),
+    (4, 6, '清明节'),
+    (5, 1, '劳动节'),
+    (5, 2, '劳动节'),
+    (5, 3, '劳动节'),
+    (10, 1, '国庆节'),
+    (10, 2, '国庆节'),
+    (10, 3, '国庆节'),
+    (10, 4, '国庆节'),
+    (10, 5, '国庆节'),
+    (10, 6, '国庆节'),
+    (10, 7, '国庆节'),
+)
+
+# 农历节日对照表（简化版本，实际使用中应该使用准确的农历转换算法）。
+# 导入时就构建成date对象，查询时按年份直接取用
+_LUNAR_HOLIDAYS = {
+    2024: (
+        (date(2024, 2, 10), '春节'),
+        (date(2024, 2, 11), '春节'),
+        (date(2024, 2, 12), '春节'),
+        (date(2024, 2, 13), '春节'),
+        (date(2024, 2, 14), '春节'),
+        (date(2024, 2, 15), '春节'),
+        (date(2024, 2, 16), '春节'),
+        (date(2024, 6, 10), '端午节'),
+        (date(2024, 9, 17), '中秋节'),
+    ),
+    2025: (
+        (date(2025, 1, 29), '春节'),
+        (date(2025, 1, 30), '春节'),
+        (date(2025, 1, 31), '春节'),
+        (date(2025, 2, 1), '春节'),
+        (date(2025, 2, 2), '春节'),
+        (date(2025, 2, 3), '春节'),
+        (date(2025, 2, 4), '春节'),
+        (date(2025, 5, 31), '端午节'),
+        (date(2025, 10, 6), '中秋节'),
+    ),
+}
+
+
+@lru_cache(maxsize=32)
+def _build_local_holidays(year: int) -> List[Dict]:
+    """构建本地预定义的节假日数据
+
+    结果只取决于年份，用lru_cache避免重复构建；
+    调用方只读不改，共享同一个列表是安全的。
+    """
+    holidays = [{
+        'date': f'{year}-{month:02d}-{day:02d}',
+        'date_obj': date(year, month, day),
+        'name': name,
+        'holiday': True
+    } for month, day, name in _FIXED_HOLIDAYS]
+
+    holidays.extend(_build_lunar_holidays(year))
+
+    # 日期对象直接比较，比字符串排序省去逐字符比对
+    holidays.sort(key=lambda x: x['date_obj'])
+    return holidays
+
+
+def _build_lunar_holidays(year: int) -> List[Dict]:
+    """构建农历节日数据（简化版本）"""
+    return [{
+        'date': holiday_date.isoformat(),
+        'date_obj': holiday_date,
+        'name': name,
+        'holiday': True
+    } for holiday_date, name in _LUNAR_HOLIDAYS.get(year, ())]
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "holiday_countdown_tool",
+    "description": "计算距离下次中国法定节假日还有多长时间",
+    "parameters": {
+        "year": {
+            "type": "int",
+            "description": "查询年份，默认为当前年份",
+            "required": False
+        },
+        "show_all": {
+            "type": "bool",
+            "description": "是否显示全年所有节假日信息",
+            "required": False,
+            "default": False
+        },
+        "source": {
+            "type": "string",
+            "description": "数据源：api(在线API)、local(本地数据)",
+            "required": False,
+            "default": "api"
+        },
+        "format": {
+            "type": "string",
+            "description": "输出格式：simple(简洁)、detailed(详细)",
+            "required": False,
+            "default": "simple"
+        }
+    }
+}
+
 
 class HolidayCountdownTool(BaseTool):
     """法定节假日倒计时工具类"""
-    
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "holiday_countdown_tool", 
-            "description": "计算距离下次中国法定节假日还有多长时间",
-            "parameters": {
-                "year": {
-                    "type": "int",
-                    "description": "查询年份，默认为当前年份",
-                    "required": False
-                },
-                "show_all": {
-                    "type": "bool",
-                    "description": "是否显示全年所有节假日信息",
-                    "required": False,
-                    "default": False
-                },
-                "source": {
-                    "type": "string",
-                    "description": "数据源：api(在线API)、local(本地数据)",
-                    "required": False,
-                    "default": "api"
-                },
-                "format": {
-                    "type": "string",
-                    "description": "输出格式：simple(简洁)、detailed(详细)",
-                    "required": False,
-                    "default": "simple"
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def execute(self, args: Dict[str, Any]) -> str:
         """执行节假日倒计时计算"""
         # 验证参数
         self.validate_args(args)
         
-        current_year = datetime.now().year
+        # 当天日期只取一次，后续计算统一以它为基准；
+        # date.today()比datetime.now()省去构造完整时间部分
+        today = date.today()
+        current_year = today.year
         year = args.get('year', current_year)
         show_all = args.get('show_all', False)
         source = args.get('source', 'api').lower()
@@ -64,10 +234,10 @@ class HolidayCountdownTool(BaseTool):
         if year < 2020 or year > 2030:
             raise ValueError("年份必须在2020-2030之间")
         
-        if source not in ['api', 'local']:
+        if source not in _VALID_SOURCES:
             raise ValueError("数据源必须是 api 或 local")
-        
-        if format_type not in ['simple', 'detailed']:
+
+        if format_type not in _VALID_FORMATS:
             raise ValueError("输出格式必须是 simple 或 detailed")
         
         try:
@@ -75,7 +245,7 @@ class HolidayCountdownTool(BaseTool):
             holidays = self._get_holidays(year, source)
             
             # 计算倒计时
-            result = self._calculate_countdown(holidays, show_all, format_type)
+            result = self._calculate_countdown(holidays, show_all, format_type, today)
             
             return result
             
@@ -85,20 +255,35 @@ class HolidayCountdownTool(BaseTool):
     def _get_holidays(self, year: int, source: str) -> List[Dict]:
         """获取节假日数据"""
         if source == 'api':
-            return self._get_holidays_from_api(year)
+            holidays = self._get_holidays_from_api(year)
         else:
-            return self._get_local_holidays(year)
+            holidays = self._get_local_holidays(year)
+
+        # 预解析日期对象：fromisoformat走C实现的固定格式快路径，
+        # 且每条数据只解析一次，倒计时阶段直接做date比较
+        for holiday in holidays:
+            if 'date_obj' not in holiday:
+                holiday['date_obj'] = date.fromisoformat(holiday['date'])
+        return holidays
     
     def _get_holidays_from_api(self, year: int) -> List[Dict]:
-        """从API获取节假日数据"""
+        """从API获取节假日数据，一天内的重复查询直接走缓存"""
+        cached = _cache_get(year)
+        if cached is not None:
+            return cached
+
+        # requests及其依赖链只在真正走网络时才导入，
+        # source=local和命中缓存的调用完全不用付这笔导入开销
+        import requests
+
         try:
             # 使用免费的节假日API
             url = f"https://timor.tech/api/holiday/year/{year}"
-            response = requests.get(url, timeout=10)
+            response = _get_session().get(url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            
+            data = _json_loads(response.content)
+
             if data.get('code') != 0:
                 raise Exception(f"API返回错误: {data.get('message', '未知错误')}")
             
@@ -113,151 +298,65 @@ class HolidayCountdownTool(BaseTool):
                     'type': 'holiday' if info.get('holiday', False) else 'workday'
                 })
             
-            return sorted(holidays, key=lambda x: x['date'])
-            
+            holidays.sort(key=lambda x: x['date'])
+            # 只缓存成功的API结果，本地回退数据不写缓存
+            _cache_set(year, holidays)
+            return holidays
+
         except requests.RequestException:
             # 网络错误时回退到本地数据
             return self._get_local_holidays(year)
     
     def _get_local_holidays(self, year: int) -> List[Dict]:
         """获取本地预定义的节假日数据"""
-        # 中国法定节假日（需要根据实际情况更新）
-        holidays_template = {
-            # 元旦
-            'new_year': {'name': '元旦', 'month': 1, 'day': 1, 'duration': 3},
-            # 春节（农历，需要计算）
-            'spring_festival': {'name': '春节', 'lunar': True},
-            # 清明节（通常4月4-6日）
-            'qingming': {'name': '清明节', 'month': 4, 'day': 4, 'duration': 3},
-            # 劳动节
-            'labor_day': {'name': '劳动节', 'month': 5, 'day': 1, 'duration': 5},
-            # 端午节（农历五月初五，需要计算）
-            'dragon_boat': {'name': '端午节', 'lunar': True},
-            # 中秋节（农历八月十五，需要计算）
-            'mid_autumn': {'name': '中秋节', 'lunar': True},
-            # 国庆节
-            'national_day': {'name': '国庆节', 'month': 10, 'day': 1, 'duration': 7}
-        }
-        
-        holidays = []
-        
-        # 固定日期的节假日
-        fixed_holidays = [
-            {'date': f'{year}-01-01', 'name': '元旦', 'holiday': True},
-            {'date': f'{year}-04-04', 'name': '清明节', 'holiday': True},
-            {'date': f'{year}-04-05', 'name': '清明节', 'holiday': True},
-            {'date': f'{year}-04-06', 'name': '清明节', 'holiday': True},
-            {'date': f'{year}-05-01', 'name': '劳动节', 'holiday': True},
-            {'date': f'{year}-05-02', 'name': '劳动节', 'holiday': True},
-            {'date': f'{year}-05-03', 'name': '劳动节', 'holiday': True},
-            {'date': f'{year}-10-01', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-02', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-03', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-04', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-05', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-06', 'name': '国庆节', 'holiday': True},
-            {'date': f'{year}-10-07', 'name': '国庆节', 'holiday': True},
-        ]
-        
-        # 添加农历节日（简化版本，实际需要农历转换）
-        lunar_holidays = self._get_lunar_holidays(year)
-        fixed_holidays.extend(lunar_holidays)
-        
-        return sorted(fixed_holidays, key=lambda x: x['date'])
-    
+        return _build_local_holidays(year)
+
     def _get_lunar_holidays(self, year: int) -> List[Dict]:
         """获取农历节日（简化版本）"""
-        # 这里提供一个简化的农历节日日期
-        # 实际使用中应该使用准确的农历转换算法
-        lunar_dates = {
-            2024: {
-                'spring_festival': ['02-10', '02-11', '02-12', '02-13', '02-14', '02-15', '02-16'],
-                'dragon_boat': ['06-10'],
-                'mid_autumn': ['09-17']
-            },
-            2025: {
-                'spring_festival': ['01-29', '01-30', '01-31', '02-01', '02-02', '02-03', '02-04'],
-                'dragon_boat': ['05-31'],
-                'mid_autumn': ['10-06']
-            }
-        }
-        
-        holidays = []
-        if year in lunar_dates:
-            # 春节
-            for date_str in lunar_dates[year]['spring_festival']:
-                holidays.append({
-                    'date': f'{year}-{date_str}',
-                    'name': '春节',
-                    'holiday': True
-                })
-            
-            # 端午节
-            for date_str in lunar_dates[year]['dragon_boat']:
-                holidays.append({
-                    'date': f'{year}-{date_str}',
-                    'name': '端午节',
-                    'holiday': True
-                })
-            
-            # 中秋节
-            for date_str in lunar_dates[year]['mid_autumn']:
-                holidays.append({
-                    'date': f'{year}-{date_str}',
-                    'name': '中秋节',
-                    'holiday': True
-                })
-        
-        return holidays
+        return _build_lunar_holidays(year)
     
-    def _calculate_countdown(self, holidays: List[Dict], show_all: bool, format_type: str) -> str:
+    def _calculate_countdown(self, holidays: List[Dict], show_all: bool,
+                             format_type: str, today: date) -> str:
         """计算倒计时"""
-        today = date.today()
-        today_str = today.strftime('%Y-%m-%d')
-        
-        # 过滤出真正的节假日
+        # 过滤出真正的节假日（数据源已按日期排好序）
         holiday_list = [h for h in holidays if h.get('holiday', False)]
-        
-        # 找到下一个节假日
-        next_holiday = None
-        upcoming_holidays = []
-        
-        for holiday in holiday_list:
-            holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d').date()
-            
-            if holiday_date >= today:
-                upcoming_holidays.append({
-                    'name': holiday['name'],
-                    'date': holiday_date,
-                    'days_left': (holiday_date - today).days
-                })
-                
-                if next_holiday is None:
-                    next_holiday = {
-                        'name': holiday['name'],
-                        'date': holiday_date,
-                        'days_left': (holiday_date - today).days
-                    }
-        
-        # 格式化输出
+
+        # 列表有序，在预解析日期的平行列表上二分定位第一个
+        # 未过去的节假日（bisect的key=参数要3.10+，这里不用）
+        dates = [h['date_obj'] for h in holiday_list]
+        idx = bisect.bisect_left(dates, today)
+
+        # 格式化输出。默认路径直接把原始节假日行传给格式化函数，
+        # 不再构造中间包装字典和列表
         if show_all:
-            return self._format_all_holidays(upcoming_holidays, format_type)
-        else:
-            return self._format_next_holiday(next_holiday, format_type)
+            return self._format_all_holidays(
+                self._list_upcoming(holiday_list, idx, today), format_type, today)
+
+        next_holiday = holiday_list[idx] if idx < len(holiday_list) else None
+        return self._format_next_holiday(next_holiday, today, format_type)
+
+    @staticmethod
+    def _list_upcoming(holiday_list: List[Dict], idx: int, today: date) -> List[Dict]:
+        """从下标idx起列出剩余节假日，一次推导式完成"""
+        return [{
+            'name': h['name'],
+            'date': h['date_obj'],
+            'days_left': (h['date_obj'] - today).days
+        } for h in holiday_list[idx:]]
     
-    def _format_next_holiday(self, next_holiday: Optional[Dict], format_type: str) -> str:
-        """格式化下一个节假日信息"""
+    def _format_next_holiday(self, next_holiday: Optional[Dict], today: date, format_type: str) -> str:
+        """格式化下一个节假日信息，直接使用原始节假日行"""
         if not next_holiday:
             return "🎉 今年已经没有更多法定节假日了！\n💡 可以用 -show_all true 查看全年节假日安排"
-        
+
         name = next_holiday['name']
-        date_obj = next_holiday['date']
-        days_left = next_holiday['days_left']
-        
+        date_obj = next_holiday['date_obj']
+        days_left = (date_obj - today).days
+
         # 格式化日期
         date_str = date_obj.strftime('%Y年%m月%d日')
-        weekday = ['周一', '周二', '周三', '周四', '周五', '周六', '周日'][date_obj.weekday()]
-        
+        weekday = _WEEKDAYS[date_obj.weekday()]
+
         if format_type == 'simple':
             if days_left == 0:
                 return f"🎉 今天就是{name}！祝您节日快乐！"
@@ -265,46 +364,48 @@ class HolidayCountdownTool(BaseTool):
                 return f"⏰ 明天就是{name}了！({date_str} {weekday})"
             else:
                 return f"⏰ 距离下次法定节假日【{name}】还有 {days_left} 天\n📅 {date_str} {weekday}"
-        
+
         else:  # detailed
-            result = f"🎯 下次法定节假日倒计时\n" + "=" * 30 + "\n"
-            result += f"🏮 节假日: {name}\n"
-            result += f"📅 日期: {date_str} {weekday}\n"
-            
+            # 输出行先收集进列表，最后一次join，避免反复字符串拼接
+            parts = [f"🎯 下次法定节假日倒计时\n{_SEP30}\n"]
+            parts.append(f"🏮 节假日: {name}\n")
+            parts.append(f"📅 日期: {date_str} {weekday}\n")
+
             if days_left == 0:
-                result += f"🎉 状态: 今天就是节假日！\n"
+                parts.append(f"🎉 状态: 今天就是节假日！\n")
             elif days_left == 1:
-                result += f"⏰ 倒计时: 明天就到了！\n"
+                parts.append(f"⏰ 倒计时: 明天就到了！\n")
             else:
                 weeks = days_left // 7
                 days = days_left % 7
-                result += f"⏰ 倒计时: {days_left} 天"
-                
                 if weeks > 0:
-                    result += f" ({weeks}周{days}天)"
-                result += "\n"
-            
+                    parts.append(f"⏰ 倒计时: {days_left} 天 ({weeks}周{days}天)\n")
+                else:
+                    parts.append(f"⏰ 倒计时: {days_left} 天\n")
+
             # 添加工作日计算
-            workdays = self._count_workdays(date.today(), date_obj)
-            result += f"💼 工作日: 约{workdays}个工作日\n"
-            
+            workdays = self._count_workdays(today, date_obj)
+            parts.append(f"💼 工作日: 约{workdays}个工作日\n")
+
             # 添加励志信息
             if days_left <= 7:
-                result += f"🚀 马上就要放假了，加油！"
+                parts.append(f"🚀 马上就要放假了，加油！")
             elif days_left <= 30:
-                result += f"⌛ 还有不到一个月，坚持住！"
+                parts.append(f"⌛ 还有不到一个月，坚持住！")
             else:
-                result += f"🌟 还需要等待一段时间，保持耐心！"
-            
-            return result
+                parts.append(f"🌟 还需要等待一段时间，保持耐心！")
+
+            return "".join(parts)
     
-    def _format_all_holidays(self, upcoming_holidays: List[Dict], format_type: str) -> str:
+    def _format_all_holidays(self, upcoming_holidays: List[Dict], format_type: str,
+                             today: date) -> str:
         """格式化所有即将到来的节假日"""
         if not upcoming_holidays:
             return "🎉 今年已经没有更多法定节假日了！"
         
-        result = f"📅 {datetime.now().year}年剩余法定节假日安排\n" + "=" * 40 + "\n"
-        
+        # 输出行先收集进列表，最后一次join，避免反复字符串拼接
+        parts = [f"📅 {today.year}年剩余法定节假日安排\n{_SEP40}\n"]
+
         # 按节假日名称分组
         holiday_groups = {}
         for holiday in upcoming_holidays:
@@ -312,54 +413,58 @@ class HolidayCountdownTool(BaseTool):
             if name not in holiday_groups:
                 holiday_groups[name] = []
             holiday_groups[name].append(holiday)
-        
+
         for i, (name, group) in enumerate(holiday_groups.items(), 1):
-            # 获取第一天和最后一天
-            first_day = min(group, key=lambda x: x['date'])
-            last_day = max(group, key=lambda x: x['date'])
+            # 输入已按日期排序，分组时保持了顺序，
+            # 首尾元素就是第一天和最后一天，不用再min/max扫一遍
+            first_day = group[0]
+            last_day = group[-1]
             duration = len(group)
-            
+
             if format_type == 'simple':
                 if duration == 1:
                     date_str = first_day['date'].strftime('%m月%d日')
-                    result += f"{i}. {name} - {date_str} (还有{first_day['days_left']}天)\n"
+                    parts.append(f"{i}. {name} - {date_str} (还有{first_day['days_left']}天)\n")
                 else:
                     start_date = first_day['date'].strftime('%m月%d日')
                     end_date = last_day['date'].strftime('%m月%d日')
-                    result += f"{i}. {name} - {start_date}~{end_date} 共{duration}天 (还有{first_day['days_left']}天)\n"
-            
+                    parts.append(f"{i}. {name} - {start_date}~{end_date} 共{duration}天 (还有{first_day['days_left']}天)\n")
+
             else:  # detailed
                 start_date = first_day['date'].strftime('%Y年%m月%d日')
                 end_date = last_day['date'].strftime('%Y年%m月%d日')
-                start_weekday = ['周一', '周二', '周三', '周四', '周五', '周六', '周日'][first_day['date'].weekday()]
-                
-                result += f"\n🏮 {name}\n"
+                start_weekday = _WEEKDAYS[first_day['date'].weekday()]
+
+                parts.append(f"\n🏮 {name}\n")
                 if duration == 1:
-                    result += f"   📅 {start_date} {start_weekday}\n"
+                    parts.append(f"   📅 {start_date} {start_weekday}\n")
                 else:
-                    result += f"   📅 {start_date} ~ {end_date}\n"
-                    result += f"   ⏱️  共 {duration} 天假期\n"
-                
-                result += f"   ⏰ 倒计时: {first_day['days_left']} 天\n"
-                
+                    parts.append(f"   📅 {start_date} ~ {end_date}\n")
+                    parts.append(f"   ⏱️  共 {duration} 天假期\n")
+
+                parts.append(f"   ⏰ 倒计时: {first_day['days_left']} 天\n")
+
                 if first_day['days_left'] <= 7:
-                    result += f"   🚀 即将到来！\n"
+                    parts.append(f"   🚀 即将到来！\n")
                 elif first_day['days_left'] <= 30:
-                    result += f"   ⌛ 不到一个月\n"
-        
-        return result
+                    parts.append(f"   ⌛ 不到一个月\n")
+
+        return "".join(parts)
     
     def _count_workdays(self, start_date: date, end_date: date) -> int:
-        """计算工作日数量（简化版本，不考虑节假日调休）"""
-        workdays = 0
-        current_date = start_date
-        
-        while current_date < end_date:
-            if current_date.weekday() < 5:  # 周一到周五
-                workdays += 1
-            current_date += timedelta(days=1)
-        
-        return workdays
+        """计算工作日数量（简化版本，不考虑节假日调休）
+
+        闭式计算：整周固定贡献5个工作日，剩余几天按起始星期
+        逐个判断（最多6次），不用逐日循环构造date对象。
+        """
+        days = (end_date - start_date).days
+        if days <= 0:
+            return 0
+
+        full_weeks, rem = divmod(days, 7)
+        start_weekday = start_date.weekday()
+        extra = sum(1 for i in range(rem) if (start_weekday + i) % 7 < 5)
+        return full_weeks * 5 + extra
 
 
 # 实例化工具
@@ -382,7 +487,7 @@ def main():
     
     # 创建参数解析器
     parser = argparse.ArgumentParser(description='法定节假日倒计时工具')
-    parser.add_argument('-year', type=int, default=datetime.now().year,
+    parser.add_argument('-year', type=int, default=date.today().year,
                        help='查询年份')
     parser.add_argument('-show_all', action='store_true',
                        help='显示全年所有节假日信息')
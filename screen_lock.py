@@ -7,42 +7,55 @@
 
 import os
 import time
+import ctypes
 import subprocess
 import sys
 from typing import Dict, Any
 from tool_base import BaseTool
 
 
+# Windows下锁屏只是一次Win32调用，缓存user32句柄直接调用，
+# 不必为此起一个rundll32子进程
+_USER32 = ctypes.windll.user32 if os.name == 'nt' else None
+
+# 确认提示接受的肯定回答
+_YES_ANSWERS = frozenset(('y', 'yes', 'true', '1'))
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "screen_lock",
+    "description": "自动锁屏工具，支持立即锁屏和延时锁屏",
+    "parameters": {
+        "delay": {
+            "type": "int",
+            "description": "延时锁屏时间(秒)，0表示立即锁屏",
+            "required": False,
+            "default": 0
+        },
+        "message": {
+            "type": "string",
+            "description": "锁屏前显示的提示消息",
+            "required": False,
+            "default": "即将锁屏..."
+        },
+        "confirm": {
+            "type": "bool",
+            "description": "是否需要用户确认才锁屏",
+            "required": False,
+            "default": False
+        }
+    }
+}
+
+
 class ScreenLockTool(BaseTool):
     """自动锁屏工具类"""
-    
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "screen_lock",
-            "description": "自动锁屏工具，支持立即锁屏和延时锁屏",
-            "parameters": {
-                "delay": {
-                    "type": "int",
-                    "description": "延时锁屏时间(秒)，0表示立即锁屏",
-                    "required": False,
-                    "default": 0
-                },
-                "message": {
-                    "type": "string",
-                    "description": "锁屏前显示的提示消息",
-                    "required": False,
-                    "default": "即将锁屏..."
-                },
-                "confirm": {
-                    "type": "bool",
-                    "description": "是否需要用户确认才锁屏",
-                    "required": False,
-                    "default": False
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def execute(self, args: Dict[str, Any]) -> str:
         """执行锁屏操作"""
         # 验证参数
@@ -56,18 +69,21 @@ class ScreenLockTool(BaseTool):
         # 如果需要确认
         if confirm:
             response = input(f"{message} 是否继续? (y/N): ")
-            if response.lower() not in ['y', 'yes', 'true', '1']:
+            if response.lower() not in _YES_ANSWERS:
                 return "锁屏操作已取消"
         
         # 延时处理
         if delay > 0:
             print(f"{message}")
-            for i in range(delay, 0, -1):
-                print(f"锁屏倒计时: {i} 秒...", end='\r')
-                time.sleep(1)
-            print()  # 换行
-        
-        # 执行锁屏
+            self._wait_countdown(delay)
+
+        # 执行锁屏：优先直接调用Win32接口
+        if _USER32 is not None:
+            if _USER32.LockWorkStation():
+                return "屏幕已锁定"
+            return f"锁屏失败: WinError {ctypes.GetLastError()}"
+
+        # 特殊环境下拿不到user32时回退到rundll32
         try:
             # Windows锁屏命令
             subprocess.run(['rundll32.exe', 'user32.dll,LockWorkStation'], check=True)
@@ -77,6 +93,24 @@ class ScreenLockTool(BaseTool):
         except FileNotFoundError:
             return "锁屏命令不可用 (仅支持Windows)"
 
+    def _wait_countdown(self, delay: int):
+        """等待延时时间
+
+        按单调时钟的截止点计时，逐秒sleep(1)的累积漂移不会出现；
+        非交互终端没人看倒计时，直接一次睡满省去逐秒打印和唤醒。
+        """
+        if sys.stdout.isatty():
+            deadline = time.monotonic() + delay
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                print(f"锁屏倒计时: {int(remaining) + 1} 秒...", end='\r', flush=True)
+                time.sleep(min(1.0, remaining))
+            print()  # 换行
+        else:
+            time.sleep(delay)
+
 
 # 实例化工具
 _tool_instance = ScreenLockTool()
@@ -13,47 +13,63 @@ from typing import Dict, Any
 from tool_base import BaseTool
 
 
+# 参数合法值与确认回答，常量化省去每次调用重建列表
+_VALID_ACTIONS = frozenset(('shutdown', 'restart', 'cancel'))
+_YES_ANSWERS = frozenset(('y', 'yes', 'true', '1'))
+
+# 操作到 (shutdown命令参数, 中文描述) 的映射，
+# 一张表代替两处平行的三元表达式，避免两边不同步
+_ACTION_TABLE = {
+    'shutdown': ('/s', '关机'),
+    'restart': ('/r', '重启'),
+}
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "shutdown_tool",
+    "description": "自动关机、重启工具，支持延时和立即执行",
+    "parameters": {
+        "action": {
+            "type": "string",
+            "description": "执行的操作类型：shutdown(关机)、restart(重启)、cancel(取消)",
+            "required": True
+        },
+        "delay": {
+            "type": "int",
+            "description": "延时执行时间(秒)，0表示立即执行",
+            "required": False,
+            "default": 30
+        },
+        "message": {
+            "type": "string",
+            "description": "执行前显示的提示消息",
+            "required": False,
+            "default": "系统即将执行操作..."
+        },
+        "confirm": {
+            "type": "bool",
+            "description": "是否需要用户确认才执行",
+            "required": False,
+            "default": True
+        },
+        "force": {
+            "type": "bool",
+            "description": "是否强制执行（关闭所有程序）",
+            "required": False,
+            "default": False
+        }
+    }
+}
+
+
 class ShutdownTool(BaseTool):
     """自动关机、重启工具类"""
-    
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "shutdown_tool",
-            "description": "自动关机、重启工具，支持延时和立即执行",
-            "parameters": {
-                "action": {
-                    "type": "string",
-                    "description": "执行的操作类型：shutdown(关机)、restart(重启)、cancel(取消)",
-                    "required": True
-                },
-                "delay": {
-                    "type": "int",
-                    "description": "延时执行时间(秒)，0表示立即执行",
-                    "required": False,
-                    "default": 30
-                },
-                "message": {
-                    "type": "string",
-                    "description": "执行前显示的提示消息",
-                    "required": False,
-                    "default": "系统即将执行操作..."
-                },
-                "confirm": {
-                    "type": "bool",
-                    "description": "是否需要用户确认才执行",
-                    "required": False,
-                    "default": True
-                },
-                "force": {
-                    "type": "bool",
-                    "description": "是否强制执行（关闭所有程序）",
-                    "required": False,
-                    "default": False
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def execute(self, args: Dict[str, Any]) -> str:
         """执行关机或重启操作"""
         # 验证参数
@@ -67,9 +83,8 @@ class ShutdownTool(BaseTool):
         force = args.get('force', False)
         
         # 验证操作类型
-        valid_actions = ['shutdown', 'restart', 'cancel']
-        if action not in valid_actions:
-            raise ValueError(f"无效的操作类型: {action}。支持的操作: {', '.join(valid_actions)}")
+        if action not in _VALID_ACTIONS:
+            raise ValueError(f"无效的操作类型: {action}。支持的操作: shutdown, restart, cancel")
         
         # 取消关机/重启
         if action == 'cancel':
@@ -81,8 +96,8 @@ class ShutdownTool(BaseTool):
             except FileNotFoundError:
                 return "shutdown命令不可用 (仅支持Windows)"
         
-        # 设置操作描述
-        action_desc = "关机" if action == 'shutdown' else "重启"
+        # 查表取出命令参数与操作描述
+        cmd_flag, action_desc = _ACTION_TABLE[action]
         
         # 如果需要确认
         if confirm:
@@ -92,12 +107,11 @@ class ShutdownTool(BaseTool):
                 prompt = f"{message}\n系统将立即{action_desc}，是否继续? (y/N): "
             
             response = input(prompt)
-            if response.lower() not in ['y', 'yes', 'true', '1']:
+            if response.lower() not in _YES_ANSWERS:
                 return f"{action_desc}操作已取消"
         
         # 构建命令
-        cmd_action = '/s' if action == 'shutdown' else '/r'
-        cmd = ['shutdown', cmd_action, '/t', str(delay)]
+        cmd = ['shutdown', cmd_flag, '/t', str(delay)]
         
         if force:
             cmd.append('/f')  # 强制关闭应用程序
@@ -113,10 +127,7 @@ class ShutdownTool(BaseTool):
             
             # 如果延时很短，显示倒计时
             if delay <= 10:
-                for i in range(delay, 0, -1):
-                    print(f"{action_desc}倒计时: {i} 秒...", end='\r')
-                    time.sleep(1)
-                print()  # 换行
+                self._wait_countdown(delay, action_desc)
         
         # 执行命令
         try:
@@ -132,6 +143,24 @@ class ShutdownTool(BaseTool):
         except FileNotFoundError:
             return "shutdown命令不可用 (仅支持Windows)"
 
+    def _wait_countdown(self, delay: int, action_desc: str):
+        """显示倒计时并等待
+
+        以单调时钟截止点为准，避免逐秒sleep(1)累积漂移；
+        输出不是终端时没人在看，整段一觉睡到截止点。
+        """
+        if sys.stdout.isatty():
+            deadline = time.monotonic() + delay
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                print(f"{action_desc}倒计时: {int(remaining) + 1} 秒...", end='\r', flush=True)
+                time.sleep(min(1.0, remaining))
+            print()  # 换行
+        else:
+            time.sleep(delay)
+
 
 # 实例化工具
 _tool_instance = ShutdownTool()
@@ -7,109 +7,288 @@
 
 import os
 import platform
-import psutil
 import sys
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 from tool_base import BaseTool
 
+# psutil带原生扩展，导入要几十毫秒；只在真正采集信息的
+# 方法里按需导入，仅为读取工具描述加载本模块时不用付这笔开销
+
+
+# 分区列表只在插拔介质/挂载变化时才变，30秒内直接复用枚举结果：
+# Windows上disk_partitions要逐盘符查询卷信息，网络盘慢时尤其划算
+_PARTS_TTL = 30.0
+_parts_cache = (0.0, None)
+
+
+def _partitions():
+    """带TTL的分区列表缓存"""
+    global _parts_cache
+    ts, parts = _parts_cache
+    now = time.monotonic()
+    if parts is None or now - ts >= _PARTS_TTL:
+        import psutil
+        parts = psutil.disk_partitions()
+        _parts_cache = (now, parts)
+    return parts
+
+
+@lru_cache(maxsize=1)
+def _cpu_static():
+    """核心数开机后不会变化，频率也极少变动，取一次即可"""
+    import psutil
+    return (psutil.cpu_count(logical=False),
+            psutil.cpu_count(logical=True),
+            psutil.cpu_freq())
+
+# JSON输出优先走orjson，嵌套信息字典的序列化快一个数量级；
+# orjson默认输出UTF-8，效果等同ensure_ascii=False
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# 文本报告的头部固定不变，拼一次当常量用
+_REPORT_HEADER = "=" * 50 + "\n系统信息报告\n" + "=" * 50
+
+# 换算基数只算一次，不在每个字段里重复求 1024**3
+_GIB = 1024 ** 3
+_MIB = 1024 ** 2
+
+
+def _fmt_gib(n: int) -> str:
+    """字节数转成保留两位小数的GB字符串"""
+    return f"{n / _GIB:.2f}"
+
+
+# 返回字典的键名固定，提成常量元组后每次调用只做一次
+# dict(zip(...))构建，不再逐键重建字典字面量
+_CPU_KEYS = ("CPU核心数", "CPU逻辑核心数", "CPU使用率(%)", "CPU频率(MHz)")
+_MEM_KEYS = ("总内存(GB)", "可用内存(GB)", "已使用内存(GB)", "内存使用率(%)",
+             "交换分区大小(GB)", "交换分区使用率(%)")
+
+
+def _get_login_name() -> str:
+    """当前登录用户名，无控制终端的环境下取不到时返回未知"""
+    try:
+        return os.getlogin()
+    except (AttributeError, OSError):
+        return "未知"
+
+
+# 平台信息在进程生命周期内不变，只采集一次：
+# platform.processor()在Windows上要起WMIC子进程，重复调用很贵
+_STATIC_SYSINFO = {
+    "操作系统": platform.system(),
+    "系统版本": platform.release(),
+    "系统详细版本": platform.version(),
+    "机器类型": platform.machine(),
+    "处理器": platform.processor(),
+    "计算机名": platform.node(),
+    "用户名": _get_login_name(),
+}
+
+
+@lru_cache(maxsize=1)
+def _get_host_addresses():
+    """主机名和本机IPv4地址只取一次
+
+    gethostbyname在DNS配置不当的机器上可能触发外部解析、
+    阻塞数秒；net_if_addrs只读内核接口表，纯本地且不走网络。
+    失败时不缓存、下次调用重试。
+    """
+    import psutil
+    hostname = socket.gethostname()
+    local_ips = [addr.address
+                 for ifaces in psutil.net_if_addrs().values()
+                 for addr in ifaces
+                 if addr.family == socket.AF_INET
+                 and not addr.address.startswith('127.')]
+    return hostname, ', '.join(local_ips) if local_ips else '127.0.0.1'
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "system_info",
+    "description": "获取系统信息，包括CPU、内存、磁盘、网络等",
+    "parameters": {
+        "info_type": {
+            "type": "string",
+            "description": "信息类型：all(所有), cpu(CPU信息), memory(内存), disk(磁盘), network(网络), system(系统基本信息)",
+            "required": False,
+            "default": "all"
+        },
+        "format": {
+            "type": "string",
+            "description": "输出格式：text(文本), json(JSON格式)",
+            "required": False,
+            "default": "text"
+        }
+    }
+}
+
 
 class SystemInfoTool(BaseTool):
     """系统信息工具类"""
-    
+
+    # CPU使用率读数的最短刷新间隔(秒)，间隔内重复查询直接复用
+    _MIN_INTERVAL = 2.0
+
+    # info_type到(输出标签, 采集方法)的注册表，
+    # 代替execute里逐个重建列表字面量的五连if
+    _COLLECTORS = (
+        ('system', '系统信息', 'get_system_info'),
+        ('cpu', 'CPU信息', 'get_cpu_info'),
+        ('memory', '内存信息', 'get_memory_info'),
+        ('disk', '磁盘信息', 'get_disk_info'),
+        ('network', '网络信息', 'get_network_info'),
+    )
+
+    def __init__(self):
+        self._last_cpu_ts = 0.0
+        self._last_cpu_value = 0.0
+        # 网卡计数器快照同样按TTL节流
+        self._last_net_ts = 0.0
+        self._last_net = None
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "system_info",
-            "description": "获取系统信息，包括CPU、内存、磁盘、网络等",
-            "parameters": {
-                "info_type": {
-                    "type": "string",
-                    "description": "信息类型：all(所有), cpu(CPU信息), memory(内存), disk(磁盘), network(网络), system(系统基本信息)",
-                    "required": False,
-                    "default": "all"
-                },
-                "format": {
-                    "type": "string",
-                    "description": "输出格式：text(文本), json(JSON格式)",
-                    "required": False,
-                    "default": "text"
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def get_system_info(self) -> Dict[str, Any]:
         """获取系统基本信息"""
+        # 静态信息直接复用缓存，只有当前时间每次重新取
         return {
-            "操作系统": platform.system(),
-            "系统版本": platform.release(),
-            "系统详细版本": platform.version(),
-            "机器类型": platform.machine(),
-            "处理器": platform.processor(),
-            "计算机名": platform.node(),
-            "用户名": os.getlogin() if hasattr(os, 'getlogin') else "未知",
+            **_STATIC_SYSINFO,
             "当前时间": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
     
     def get_cpu_info(self) -> Dict[str, Any]:
         """获取CPU信息"""
-        return {
-            "CPU核心数": psutil.cpu_count(logical=False),
-            "CPU逻辑核心数": psutil.cpu_count(logical=True),
-            "CPU使用率(%)": psutil.cpu_percent(interval=1),
-            "CPU频率(MHz)": f"{psutil.cpu_freq().current:.2f}" if psutil.cpu_freq() else "未知"
-        }
+        import psutil
+
+        # 使用率读数带TTL节流：间隔内的重复调用复用上次结果，
+        # 之后用非阻塞采样取增量，整个调用不再阻塞1秒
+        now = time.monotonic()
+        if now - self._last_cpu_ts >= self._MIN_INTERVAL:
+            if self._last_cpu_ts == 0.0:
+                # 首次调用没有基线，做一次0.1秒的短采样
+                self._last_cpu_value = psutil.cpu_percent(interval=0.1)
+            else:
+                self._last_cpu_value = psutil.cpu_percent(interval=None)
+            self._last_cpu_ts = now
+
+        physical, logical, freq = _cpu_static()
+        return dict(zip(_CPU_KEYS, (
+            physical,
+            logical,
+            self._last_cpu_value,
+            f"{freq.current:.2f}" if freq else "未知",
+        )))
     
     def get_memory_info(self) -> Dict[str, Any]:
         """获取内存信息"""
+        import psutil
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        return {
-            "总内存(GB)": f"{mem.total / (1024**3):.2f}",
-            "可用内存(GB)": f"{mem.available / (1024**3):.2f}",
-            "已使用内存(GB)": f"{mem.used / (1024**3):.2f}",
-            "内存使用率(%)": f"{mem.percent:.1f}",
-            "交换分区大小(GB)": f"{swap.total / (1024**3):.2f}",
-            "交换分区使用率(%)": f"{swap.percent:.1f}"
-        }
+        return dict(zip(_MEM_KEYS, (
+            _fmt_gib(mem.total),
+            _fmt_gib(mem.available),
+            _fmt_gib(mem.used),
+            f"{mem.percent:.1f}",
+            _fmt_gib(swap.total),
+            f"{swap.percent:.1f}",
+        )))
     
     def get_disk_info(self) -> Dict[str, Any]:
-        """获取磁盘信息"""
-        disk_info = {}
-        for partition in psutil.disk_partitions():
-            try:
-                partition_usage = psutil.disk_usage(partition.mountpoint)
-                disk_info[f"磁盘 {partition.device}"] = {
-                    "文件系统": partition.fstype,
-                    "挂载点": partition.mountpoint,
-                    "总大小(GB)": f"{partition_usage.total / (1024**3):.2f}",
-                    "已使用(GB)": f"{partition_usage.used / (1024**3):.2f}",
-                    "剩余空间(GB)": f"{partition_usage.free / (1024**3):.2f}",
-                    "使用率(%)": f"{(partition_usage.used / partition_usage.total) * 100:.1f}"
-                }
-            except PermissionError:
-                disk_info[f"磁盘 {partition.device}"] = "无访问权限"
-        return disk_info
+        """获取磁盘信息
+
+        disk_usage是会释放GIL的阻塞系统调用，逐个串行探测时
+        一个慢的网络盘/移动盘会拖住整个循环，并发探测后总耗时
+        取决于最慢的一个分区而不是所有分区之和。
+        """
+        partitions = _partitions()
+        if not partitions:
+            return {}
+
+        results = {}
+        # 不用with：上下文退出会shutdown(wait=True)，等挂死的探测线程
+        # 返回，超时就失去意义；收完结果后不等待直接shutdown
+        executor = ThreadPoolExecutor(max_workers=min(8, len(partitions)))
+        futures = {executor.submit(self._probe_partition, p): p
+                   for p in partitions}
+        try:
+            # 整体超时兜底，挂死的网络挂载点不会卡住info_type='all'
+            for future in as_completed(futures, timeout=5):
+                partition = futures[future]
+                results[partition.device] = future.result()
+        except FuturesTimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False)
+
+        # 按分区枚举顺序组装输出，超时未返回的标记出来
+        return {f"磁盘 {p.device}": results.get(p.device, "读取超时")
+                for p in partitions}
+
+    @staticmethod
+    def _probe_partition(partition) -> Any:
+        """探测单个分区的用量并格式化"""
+        import psutil
+        try:
+            partition_usage = psutil.disk_usage(partition.mountpoint)
+        except PermissionError:
+            return "无访问权限"
+        except OSError as e:
+            return f"读取失败: {e}"
+        return {
+            "文件系统": partition.fstype,
+            "挂载点": partition.mountpoint,
+            "总大小(GB)": _fmt_gib(partition_usage.total),
+            "已使用(GB)": _fmt_gib(partition_usage.used),
+            "剩余空间(GB)": _fmt_gib(partition_usage.free),
+            "使用率(%)": f"{(partition_usage.used / partition_usage.total) * 100:.1f}"
+        }
     
     def get_network_info(self) -> Dict[str, Any]:
         """获取网络信息"""
+        import psutil
         network_info = {}
-        
-        # 网络接口信息
-        net_io = psutil.net_io_counters(pernic=True)
-        for interface, stats in net_io.items():
+
+        # 网络接口信息：遍历全部网卡要逐个查询内核计数器，
+        # 虚拟网卡多的机器上不便宜，间隔内重复调用复用上次快照
+        now = time.monotonic()
+        if self._last_net is None or now - self._last_net_ts >= self._MIN_INTERVAL:
+            self._last_net = psutil.net_io_counters(pernic=True)
+            self._last_net_ts = now
+
+        for interface, stats in self._last_net.items():
+            # 从未有过流量的网卡（休眠的虚拟接口等）不值得展示
+            if stats.bytes_sent == 0 and stats.bytes_recv == 0:
+                continue
             network_info[f"网卡 {interface}"] = {
-                "发送字节数": f"{stats.bytes_sent / (1024**2):.2f} MB",
-                "接收字节数": f"{stats.bytes_recv / (1024**2):.2f} MB",
+                "发送字节数": f"{stats.bytes_sent / _MIB:.2f} MB",
+                "接收字节数": f"{stats.bytes_recv / _MIB:.2f} MB",
                 "发送包数": stats.packets_sent,
                 "接收包数": stats.packets_recv
             }
         
         # IP地址信息
         try:
-            hostname = socket.gethostname()
-            local_ip = socket.gethostbyname(hostname)
+            hostname, local_ip = _get_host_addresses()
             network_info["网络配置"] = {
                 "主机名": hostname,
                 "本地IP": local_ip
@@ -128,51 +307,42 @@ class SystemInfoTool(BaseTool):
         info_type = args.get('info_type', 'all').lower()
         output_format = args.get('format', 'text').lower()
         
-        # 收集信息
-        all_info = {}
-        
-        if info_type in ['all', 'system']:
-            all_info['系统信息'] = self.get_system_info()
-        
-        if info_type in ['all', 'cpu']:
-            all_info['CPU信息'] = self.get_cpu_info()
-        
-        if info_type in ['all', 'memory']:
-            all_info['内存信息'] = self.get_memory_info()
-        
-        if info_type in ['all', 'disk']:
-            all_info['磁盘信息'] = self.get_disk_info()
-        
-        if info_type in ['all', 'network']:
-            all_info['网络信息'] = self.get_network_info()
-        
+        # 收集信息：按注册表分发，保持原有的分类顺序
+        all_info = {label: getattr(self, method)()
+                    for key, label, method in self._COLLECTORS
+                    if info_type == 'all' or info_type == key}
+
+
         # 格式化输出
         if output_format == 'json':
-            import json
-            return json.dumps(all_info, ensure_ascii=False, indent=2)
+            return _json_dumps(all_info)
         else:
             return self.format_text_output(all_info)
     
     def format_text_output(self, info: Dict[str, Any]) -> str:
-        """格式化文本输出"""
-        lines = []
-        lines.append("=" * 50)
-        lines.append("系统信息报告")
-        lines.append("=" * 50)
-        
+        """格式化文本输出
+
+        输出行收集进一个列表最后一次join，头部分隔线用预拼好的常量；
+        嵌套字典用extend批量展开，减少逐行append的调用次数。
+        """
+        lines = [_REPORT_HEADER]
+        # 方法查找提到循环外，热循环里少一次属性解析
+        append = lines.append
+        extend = lines.extend
+
         for category, data in info.items():
-            lines.append(f"\n【{category}】")
+            append(f"\n【{category}】")
             if isinstance(data, dict):
                 for key, value in data.items():
                     if isinstance(value, dict):
-                        lines.append(f"  {key}:")
-                        for sub_key, sub_value in value.items():
-                            lines.append(f"    {sub_key}: {sub_value}")
+                        append(f"  {key}:")
+                        extend(f"    {sub_key}: {sub_value}"
+                               for sub_key, sub_value in value.items())
                     else:
-                        lines.append(f"  {key}: {value}")
+                        append(f"  {key}: {value}")
             else:
-                lines.append(f"  {data}")
-        
+                append(f"  {data}")
+
         return "\n".join(lines)
 
 
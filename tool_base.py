@@ -49,26 +49,33 @@ class BaseTool(ABC):
     def validate_args(self, args: Dict[str, Any]) -> bool:
         """
         验证参数
-        
+
         Args:
             args: 参数字典
-            
+
         Returns:
             验证是否通过
         """
-        description = self.get_description()
-        parameters = description.get('parameters', {})
-        
-        # 检查必需参数
-        for param_name, param_info in parameters.items():
-            if param_info.get('required', False) and param_name not in args:
-                raise ValueError(f"缺少必需参数: {param_name}")
-        
-        # 检查未知参数
-        for param_name in args:
-            if param_name not in parameters:
-                raise ValueError(f"未知参数: {param_name}")
-        
+        # 参数名集合按子类缓存，首次调用时从描述解析一次，
+        # 之后的验证只剩两次集合运算，不再逐参数遍历描述字典
+        cls = type(self)
+        param_names = cls.__dict__.get('_param_names')
+        if param_names is None:
+            parameters = self.get_description().get('parameters', {})
+            param_names = frozenset(parameters)
+            cls._param_names = param_names
+            cls._required_params = frozenset(
+                name for name, info in parameters.items()
+                if info.get('required', False))
+
+        missing = cls._required_params - args.keys()
+        if missing:
+            raise ValueError(f"缺少必需参数: {sorted(missing)[0]}")
+
+        unknown = args.keys() - param_names
+        if unknown:
+            raise ValueError(f"未知参数: {sorted(unknown)[0]}")
+
         return True
 
 
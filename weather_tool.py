@@ -5,50 +5,101 @@
 获取指定城市的天气信息，默认获取杭州天气
 """
 
-import requests
 import json
 import sys
 import re
+import time
 from typing import Dict, Any, Optional
 from tool_base import BaseTool
 
+# requests及其依赖链(urllib3等)导入要几十毫秒，
+# 推迟到真正发请求时再导入，只读工具描述不用付这笔开销
+
+# 优先使用orjson解析，wttr.in的format=j1响应有几十KB，
+# C实现的解析器明显更快；未安装时回退标准库，不引入硬依赖
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 同一城市的天气响应缓存有效期(秒)，天气数据十几分钟内基本不变
+_CACHE_TTL = 900
+
+# 描述字段缺失时的兜底节点，常量化避免每次访问都新建[{}]字面量
+_EMPTY_VAL = ({'value': 'N/A'},)
+
+
+def _desc(node: Dict) -> str:
+    """从wttr节点取天气描述，优先中文、其次英文、都没有则N/A"""
+    return (node.get('lang_zh') or node.get('weatherDesc') or _EMPTY_VAL)[0].get('value', 'N/A')
+
+
+# 工具描述构建一次复用，注册器反复列举工具时不再重建嵌套字典
+_DESCRIPTION = {
+    "name": "weather_tool",
+    "description": "获取指定城市的天气预报信息",
+    "parameters": {
+        "city": {
+            "type": "string",
+            "description": "城市名称，支持中英文，如：杭州、北京、shanghai等",
+            "required": False,
+            "default": "杭州"
+        },
+        "days": {
+            "type": "int",
+            "description": "预报天数（1-7天），1表示今天，3表示未来3天",
+            "required": False,
+            "default": 3
+        },
+        "format": {
+            "type": "string",
+            "description": "输出格式：simple(简洁)、detailed(详细)",
+            "required": False,
+            "default": "simple"
+        },
+        "source": {
+            "type": "string",
+            "description": "天气数据源：wttr(wttr.in)、openweather(OpenWeatherMap，需配置API key)",
+            "required": False,
+            "default": "wttr"
+        }
+    }
+}
+
 
 class WeatherTool(BaseTool):
     """天气预报工具类"""
-    
+
+    def __init__(self):
+        # 按URL缓存响应：工具服务器模式下同一城市的重复查询
+        # 直接复用，省掉整个HTTPS往返
+        self._cache: Dict[str, tuple] = {}
+        self._session = None
+
+    def _ensure_session(self):
+        """懒构建带连接池的共享会话
+
+        openweather一次查询要连发两个请求（地理编码+预报），
+        keep-alive省掉第二次TCP/TLS握手。
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=Retry(total=2, backoff_factor=0.3,
+                                                    status_forcelist=[502, 503, 504]))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
     def get_description(self) -> Dict[str, Any]:
         """获取工具描述"""
-        return {
-            "name": "weather_tool",
-            "description": "获取指定城市的天气预报信息",
-            "parameters": {
-                "city": {
-                    "type": "string",
-                    "description": "城市名称，支持中英文，如：杭州、北京、shanghai等",
-                    "required": False,
-                    "default": "杭州"
-                },
-                "days": {
-                    "type": "int",
-                    "description": "预报天数（1-7天），1表示今天，3表示未来3天",
-                    "required": False,
-                    "default": 3
-                },
-                "format": {
-                    "type": "string", 
-                    "description": "输出格式：simple(简洁)、detailed(详细)",
-                    "required": False,
-                    "default": "simple"
-                },
-                "source": {
-                    "type": "string",
-                    "description": "天气数据源：wttr(wttr.in)、openweather(OpenWeatherMap，需配置API key)",
-                    "required": False,
-                    "default": "wttr"
-                }
-            }
-        }
-    
+        return _DESCRIPTION
+
     def execute(self, args: Dict[str, Any]) -> str:
         """执行天气查询"""
         # 验证参数
@@ -77,14 +128,43 @@ class WeatherTool(BaseTool):
         except Exception as e:
             return f"获取天气信息失败: {str(e)}"
     
-    def _make_request(self, url: str, headers: Optional[Dict] = None, timeout: int = 10) -> requests.Response:
-        """发起HTTP请求"""
+    def _make_request(self, url: str, headers: Optional[Dict] = None, timeout: int = 10) -> Any:
+        """发起HTTP请求，有效期内的重复请求直接走缓存"""
+        now = time.time()
+        entry = self._cache.get(url)
+        if entry is not None and now - entry[0] < _CACHE_TTL:
+            return entry[1]
+
+        import requests
+
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return response
+            response = self._ensure_session().get(url, headers=headers, timeout=timeout)
         except requests.exceptions.RequestException as e:
             raise Exception(f"网络请求失败: {e}")
+
+        # 直接比较状态码，省去raise_for_status为构造HTTPError
+        # 做的reason字符串格式化，200的快乐路径零额外开销
+        if response.status_code >= 400:
+            raise Exception(f"网络请求失败: HTTP {response.status_code}")
+
+        self._cache[url] = (now, response)
+        return response
+
+    def _get_json(self, url: str, headers: Optional[Dict] = None, timeout: int = 10) -> Any:
+        """请求并解析JSON，解析结果随响应一起缓存
+
+        wttr.in的j1载荷有15-30KB且大部分字段用不到，缓存命中时
+        连重新解析这一步都省掉，只在TTL窗口内解析一次。
+        """
+        now = time.time()
+        entry = self._cache.get(url)
+        if entry is not None and len(entry) == 3 and now - entry[0] < _CACHE_TTL:
+            return entry[2]
+
+        response = self._make_request(url, headers, timeout)
+        data = _json_loads(response.content)
+        self._cache[url] = (now, response, data)
+        return data
     
     def _get_weather_wttr(self, city: str, days: int, format_type: str) -> str:
         """使用wttr.in获取天气信息"""
@@ -92,12 +172,10 @@ class WeatherTool(BaseTool):
         url = f"https://wttr.in/{city}?format=j1&lang=zh"
         
         try:
-            response = self._make_request(url)
-            data = response.json()
-            
+            data = self._get_json(url)
             return self._format_weather_wttr(data, city, days, format_type)
-            
-        except json.JSONDecodeError:
+
+        except ValueError:
             # 如果JSON解析失败，尝试获取纯文本格式
             url_text = f"https://wttr.in/{city}?lang=zh&format=3"
             try:
@@ -116,31 +194,27 @@ class WeatherTool(BaseTool):
             temp = current.get('temp_C', 'N/A')
             feels_like = current.get('FeelsLikeC', 'N/A')
             humidity = current.get('humidity', 'N/A')
-            desc = current.get('lang_zh', [{}])[0].get('value', current.get('weatherDesc', [{}])[0].get('value', 'N/A'))
-            
+            desc = _desc(current)
+
             result += f"📍 当前天气:\n"
             result += f"   🌡️  温度: {temp}°C (体感 {feels_like}°C)\n"
             result += f"   ☁️  天气: {desc}\n"
             result += f"   💧 湿度: {humidity}%\n\n"
         
         # 预报天气
-        if 'weather' in data:
-            result += f"📅 未来{min(days, len(data['weather']))}天预报:\n"
-            
-            for i, day_data in enumerate(data['weather'][:days]):
+        weather = data.get('weather')
+        if weather:
+            result += f"📅 未来{min(days, len(weather))}天预报:\n"
+
+            for i, day_data in enumerate(weather[:days]):
                 date = day_data.get('date', f'第{i+1}天')
                 max_temp = day_data.get('maxtempC', 'N/A')
                 min_temp = day_data.get('mintempC', 'N/A')
                 
                 # 获取天气描述
-                desc = 'N/A'
-                if 'hourly' in day_data and day_data['hourly']:
-                    hourly = day_data['hourly'][0]
-                    if 'lang_zh' in hourly and hourly['lang_zh']:
-                        desc = hourly['lang_zh'][0].get('value', desc)
-                    elif 'weatherDesc' in hourly and hourly['weatherDesc']:
-                        desc = hourly['weatherDesc'][0].get('value', desc)
-                
+                hourly_list = day_data.get('hourly')
+                desc = _desc(hourly_list[0]) if hourly_list else 'N/A'
+
                 if format_type == 'simple':
                     result += f"   {date}: {min_temp}°C - {max_temp}°C, {desc}\n"
                 else:
@@ -170,8 +244,7 @@ class WeatherTool(BaseTool):
         geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city}&limit=1&appid={api_key}"
         
         try:
-            geo_response = self._make_request(geo_url)
-            geo_data = geo_response.json()
+            geo_data = self._get_json(geo_url)
             
             if not geo_data:
                 return f"❌ 未找到城市: {city}"
@@ -181,8 +254,7 @@ class WeatherTool(BaseTool):
             
             # 获取天气数据
             weather_url = f"http://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={api_key}&units=metric&lang=zh_cn"
-            weather_response = self._make_request(weather_url)
-            weather_data = weather_response.json()
+            weather_data = self._get_json(weather_url)
             
             return self._format_weather_openweather(weather_data, city, days, format_type)
             
@@ -207,37 +279,39 @@ class WeatherTool(BaseTool):
         if 'list' not in data:
             return "❌ 天气数据格式错误"
         
-        result = f"🌤️ {city} 天气预报 (OpenWeatherMap)\n" + "=" * 40 + "\n"
-        
+        # 输出行收集进列表最后一次join，避免循环里反复字符串拼接
+        parts = [f"🌤️ {city} 天气预报 (OpenWeatherMap)\n" + "=" * 40 + "\n"]
+
         forecasts = data['list'][:days * 8]  # 每天8个时间点（3小时间隔）
-        
+
         current_date = None
         day_count = 0
-        
+
         for forecast in forecasts:
             if day_count >= days:
                 break
-                
-            date_str = forecast['dt_txt'].split(' ')[0]
-            time_str = forecast['dt_txt'].split(' ')[1]
-            
+
+            # dt_txt格式固定为"YYYY-MM-DD HH:MM:SS"，
+            # 切片取日期部分，连split的中间列表都省掉
+            date_str = forecast['dt_txt'][:10]
+
             if date_str != current_date:
                 current_date = date_str
                 day_count += 1
-                
-                temp = forecast['main']['temp']
+
+                main = forecast['main']
+                temp = main['temp']
                 desc = forecast['weather'][0]['description']
-                humidity = forecast['main']['humidity']
-                
+
                 if format_type == 'simple':
-                    result += f"📅 {date_str}: {temp:.1f}°C, {desc}\n"
+                    parts.append(f"📅 {date_str}: {temp:.1f}°C, {desc}\n")
                 else:
-                    result += f"\n📅 {date_str}:\n"
-                    result += f"   🌡️  温度: {temp:.1f}°C\n"
-                    result += f"   ☁️  天气: {desc}\n"
-                    result += f"   💧 湿度: {humidity}%\n"
-        
-        return result
+                    parts.append(f"\n📅 {date_str}:\n")
+                    parts.append(f"   🌡️  温度: {temp:.1f}°C\n")
+                    parts.append(f"   ☁️  天气: {desc}\n")
+                    parts.append(f"   💧 湿度: {main['humidity']}%\n")
+
+        return "".join(parts)
 
 
 # 实例化工具